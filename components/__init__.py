@@ -27,7 +27,7 @@ from .active_persona import ActivePersona
 from .data_analyzer import DataAnalyzer
 from .evaluator import EvaluatorBase
 from .google_play_scraper import GooglePlayScraper
-from .llm_client import LLMClient
+from .llm_client import LLMClient, TimeoutConfig
 from .llm_factory import LLMClientFactory
 from .nielsen_evaluator import NielsenEvaluator
 from .whisper_transcriber import WhisperTranscriber
@@ -40,5 +40,6 @@ __all__ = [
     'LLMClient',
     'LLMClientFactory', 
     'NielsenEvaluator',
+    'TimeoutConfig',
     'WhisperTranscriber',
 ]
@@ -1,7 +1,97 @@
 import base64
+import functools
+import os
 from .llm_client import LLMClient
 from .logger import Logger
 
+# Read size for image encoding; a multiple of 3 so every chunk encodes
+# without base64 padding and the encoded chunks can simply be concatenated.
+_IMAGE_READ_CHUNK = 57 * 1024
+
+
+def _encode_image_b64(path: str) -> str:
+    """
+    Base64-encode an image file chunk by chunk into a preallocated buffer.
+
+    Avoids holding the raw file, the encoded bytes and the decoded string in
+    memory at the same time, which matters for multi-MB screenshots.
+    """
+    size = os.path.getsize(path)
+    out = bytearray(((size + 2) // 3) * 4)
+    pos = 0
+    with open(path, 'rb') as img_file:
+        while chunk := img_file.read(_IMAGE_READ_CHUNK):
+            encoded = base64.b64encode(chunk)
+            out[pos:pos + len(encoded)] = encoded
+            pos += len(encoded)
+    return out[:pos].decode('ascii')
+
+
+# Leading magic bytes of the image formats accepted by vision models
+_IMAGE_SIGNATURES = (
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'GIF87a', 'image/gif'),
+    (b'GIF89a', 'image/gif'),
+)
+
+
+def _detect_image_mime(path: str) -> str:
+    """Detect the image MIME type from its magic bytes (defaults to JPEG)."""
+    with open(path, 'rb') as img_file:
+        header = img_file.read(12)
+    for signature, mime in _IMAGE_SIGNATURES:
+        if header.startswith(signature):
+            return mime
+    if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+        return 'image/webp'
+    return 'image/jpeg'
+
+
+@functools.lru_cache(maxsize=64)
+def _encode_image_cached(abspath: str, mtime_ns: int, size: int) -> str:
+    """
+    Build the base64 data URL for an image.
+
+    mtime_ns and size are only part of the cache key, so an image modified
+    on disk is re-encoded instead of served stale.
+    """
+    mime = _detect_image_mime(abspath)
+    return f"data:{mime};base64,{_encode_image_b64(abspath)}"
+
+
+def _image_data_url(path: str) -> str:
+    """Return the (cached) base64 data URL for the image at path."""
+    abspath = os.path.abspath(path)
+    stat = os.stat(abspath)
+    return _encode_image_cached(abspath, stat.st_mtime_ns, stat.st_size)
+
+
+def preload_images(paths) -> list:
+    """
+    Read and base64-encode images once, returning image records.
+
+    Each record is an image message ({'type': 'image', 'path', 'b64', 'media_type'})
+    that can be passed to EvaluatorBase.set_images or process_messages, so the
+    files are not re-read or re-encoded for every persona, model and iteration.
+    """
+    records = []
+    for path in paths:
+        abspath = os.path.abspath(os.fspath(path))
+        records.append({
+            "type": "image",
+            "path": abspath,
+            "b64": _encode_image_b64(abspath),
+            "media_type": _detect_image_mime(abspath),
+        })
+    return records
+
+
+# Content part types carrying an image, and the lightweight replacement used
+# for them in older turns
+_IMAGE_PART_TYPES = ("image_url",)
+_IMAGE_OMITTED_PART = {"type": "text", "text": "[image omitted — see previous turn]"}
+
 class ActivePersona:
     """
     AI Persona for User Experience Evaluation.
@@ -31,47 +121,107 @@ class ActivePersona:
             self, 
             name: str, 
             llm_client: LLMClient, 
-            system_prompt: str = None
+            system_prompt: str = None,
+            compact_images: bool = True,
+            keep_window: int = 2
         ):
+        """
+        Args:
+            name: Persona identifier
+            llm_client: Client used to query the LLM
+            system_prompt: Persona description sent as the system message
+            compact_images: Replace images of older turns with a short text stub so
+                     they are not re-uploaded on every call (skipped for providers
+                     that cache the prompt prefix, as rewriting it would invalidate the cache)
+            keep_window: Number of most recent history messages whose images are kept
+        """
         self.name = name
         self.llm_client = llm_client
         self.system_prompt = system_prompt
-        self.message_history = []    
+        self.compact_images = compact_images
+        self.keep_window = keep_window
+        self._system_message = self._build_system_message()
+        self._static_prefix = []
+        self._dynamic_tail = []
+        self._image_turn_indices = []
         self.reset_history()
         Logger.debug(f"ActivePersona '{name}' initialized with model '{llm_client.get_model_name()}'")
     
+    @classmethod
+    def clear_image_cache(cls):
+        """
+        Drop all cached base64-encoded images.
+        """
+        _encode_image_cached.cache_clear()
+        Logger.debug("Image encoding cache cleared")
+
+    def _clone(self):
+        """
+        Create a persona with the same configuration and LLM client but its own fresh history.
+        """
+        return ActivePersona(
+            name=self.name,
+            llm_client=self.llm_client,
+            system_prompt=self.system_prompt,
+            compact_images=self.compact_images,
+            keep_window=self.keep_window
+        )
+
     def get_complete_name(self):
         return f"{self.name}_{self.llm_client.get_model_name()}"
     def get_system_prompt(self):
         return self.system_prompt
 
+    @property
+    def message_history(self):
+        """
+        Complete conversation sent to the LLM: the static prefix followed by the dynamic tail.
+        """
+        return self._static_prefix + self._dynamic_tail
+
+    def _build_system_message(self):
+        """
+        Build the system message, always sent first and unchanged.
+        
+        Providers with explicit prompt caching get the prompt as a text part marked
+        as a cache breakpoint; others cache the identical prefix automatically.
+        """
+        content = self.system_prompt
+        if content and self.llm_client.supports_prompt_caching():
+            content = [{
+                "type": "text",
+                "text": content,
+                "cache_control": {"type": "ephemeral"}
+            }]
+        return {"role": "system", "content": content}
+
     def reset_history(self):
         """
         Reset the message history for the persona.
         """
-        self.message_history = []
-                
-        # Add persona description to the message history
-        self.message_history.append({
-            "role": "system", 
-            "content": self.system_prompt
-        })
-        Logger.debug(f"Message history reset for persona '{self.name}'")
+        # The static prefix is never mutated after a reset so that providers
+        # can reuse their prompt cache for it across calls
+        self._static_prefix = [self._system_message]
+        self._dynamic_tail = []
+        self._image_turn_indices = []
+        Logger.debug("Message history reset for persona '%s'", self.name)
 
-    def interact(self, messages):
+    def process_messages(self, messages):
         """
-        Interact with the persona using messages.
+        Convert messages into content parts understood by the LLM.
         
         Args:
             messages: A single message or array of messages.
                      Each message can be:
                      - Simple text string
                      - Dict with 'type': 'text' and 'text': content
-                     - Dict with 'type': 'image' and 'path': image_file_path
+                     - Dict with 'type': 'image' and 'path': image_file_path and/or 'url': image_url
+                       (optionally preloaded with 'b64' and 'media_type', see preload_images)
+                     - Dict with 'type': 'image_url' (already processed, passed through)
                      - Dict with 'type': 'audio' and 'path': audio_file_path
         
         Returns:
-            Response from the LLM
+            list: Content parts for a user message
         """
         # Normalize to list if single message
         if not isinstance(messages, list):
@@ -83,25 +233,19 @@ class ActivePersona:
             if isinstance(message, str):
                 # Simple text message
                 processed_messages.append({"type": "text", "text": message})
-                Logger.debug(f"Processing text message for persona '{self.name}'")
+                Logger.debug("Processing text message for persona '%s'", self.name)
 
             elif isinstance(message, dict):
-                if message.get("type") == "text":
+                if message.get("type") in ("text",) + _IMAGE_PART_TYPES:
                     processed_messages.append(message)
-                    Logger.debug(f"Processing text message for persona '{self.name}'")
+                    Logger.debug("Processing %s message for persona '%s'", message['type'], self.name)
 
                 elif message.get("type") == "image":
-                    # Convert image to base64
-                    image_path = message["path"]
+                    image_url = message.get("url")
+                    image_path = message.get("path", image_url)
                     try:
-                        with open(image_path, 'rb') as img_file:
-                            img_base64 = base64.b64encode(img_file.read()).decode('utf-8')
-
-                        processed_messages.append({
-                            "type": "image_url", 
-                            "image_url": {"url": f"data:image/jpeg;base64,{img_base64}"}
-                        })
-                        Logger.debug(f"Processing image message for persona '{self.name}': {image_path}")
+                        processed_messages.append(self._process_image(image_path, image_url, message))
+                        Logger.debug("Processing image message for persona '%s': %s", self.name, image_path)
                     except FileNotFoundError:
                         Logger.error(f"Image file not found for persona '{self.name}': {image_path}")
                         raise
@@ -115,28 +259,124 @@ class ActivePersona:
                     try:
                         transcription = self.whisper_transcriber.transcribe(audio_path)
                         processed_messages.append({"type": "text", "text": transcription})
-                        Logger.debug(f"Processing audio message for persona '{self.name}': {audio_path}")
+                        Logger.debug("Processing audio message for persona '%s': %s", self.name, audio_path)
                     except Exception as e:
                         Logger.error(f"Error processing audio for persona '{self.name}': {e}")
                         raise
+
+        return processed_messages
+
+    def _process_image(self, image_path: str, image_url: str = None, record: dict = None) -> dict:
+        """
+        Build the content part for an image, avoiding base64 inlining when the client allows it.
         
-        # Create user message and add to history
-        user_msg = {"role": "user", "content": processed_messages}
-        self.message_history.append(user_msg)
+        Remote URLs are passed through to clients that support URL images; local files
+        are sent as a base64 data URL (built from the preloaded record when given).
+        """
+        if image_url and getattr(self.llm_client, 'supports_url_images', False):
+            return {"type": "image_url", "image_url": {"url": image_url}}
+
+        # Convert image to base64
+        if record and record.get("b64"):
+            data_url = f"data:{record.get('media_type', 'image/jpeg')};base64,{record['b64']}"
+            return {"type": "image_url", "image_url": {"url": data_url}}
+        return {"type": "image_url", "image_url": {"url": _image_data_url(image_path)}}
+
+    def interact(self, messages, cache_breakpoint: int = None):
+        """
+        Interact with the persona using messages.
+        
+        Args:
+            messages: A single message or array of messages (see process_messages)
+            cache_breakpoint: Index of the last content part that is identical
+                     across calls. When the provider supports explicit prompt
+                     caching, that part is marked as a cache breakpoint.
+        
+        Returns:
+            Response from the LLM
+        """
+        self._add_user_message(messages, cache_breakpoint)
         
         # Send complete message history to LLM
-        Logger.debug(f"Sending request to LLM for persona '{self.name}'")
+        Logger.debug("Sending request to LLM for persona '%s'", self.name)
         try:
             response = self.llm_client.invoke(self.message_history)
-            Logger.debug(f"Received response from LLM for persona '{self.name}'")
+            Logger.debug("Received response from LLM for persona '%s'", self.name)
         except Exception as e:
             Logger.error(f"LLM request failed for persona '{self.name}': {e}")
             raise
         
-        # Add assistant response to history
-        self.message_history.append({"role": "assistant", "content": response})
+        self._add_assistant_message(response)
+        return response
+
+    async def ainteract(self, messages, cache_breakpoint: int = None):
+        """
+        Interact with the persona using messages, without blocking the event loop.
+        
+        Same as interact, but awaits the LLM client's ainvoke.
+        """
+        self._add_user_message(messages, cache_breakpoint)
+        
+        Logger.debug("Sending async request to LLM for persona '%s'", self.name)
+        try:
+            response = await self.llm_client.ainvoke(self.message_history)
+            Logger.debug("Received response from LLM for persona '%s'", self.name)
+        except Exception as e:
+            Logger.error(f"LLM request failed for persona '{self.name}': {e}")
+            raise
         
+        self._add_assistant_message(response)
         return response
+
+    def _add_user_message(self, messages, cache_breakpoint: int = None):
+        """
+        Process the messages and append them to the history as a user message.
+        """
+        processed_messages = self.process_messages(messages)
+
+        if cache_breakpoint is not None and self.llm_client.supports_prompt_caching():
+            # Copy the part so that callers' cached messages are left untouched
+            processed_messages[cache_breakpoint] = {
+                **processed_messages[cache_breakpoint],
+                "cache_control": {"type": "ephemeral"}
+            }
+        
+        # Create user message and add to history
+        user_msg = {"role": "user", "content": processed_messages}
+        self._dynamic_tail.append(user_msg)
+        if any(part.get("type") in _IMAGE_PART_TYPES for part in processed_messages):
+            self._image_turn_indices.append(len(self._dynamic_tail) - 1)
+
+    def _add_assistant_message(self, response):
+        """
+        Append the LLM response to the history.
+        """
+        self._dynamic_tail.append({"role": "assistant", "content": response})
+        self._compact_image_turns()
+
+    def _compact_image_turns(self):
+        """
+        Replace image parts of user messages older than keep_window with a text stub.
+        """
+        if not self.compact_images or self.llm_client.supports_prompt_caching():
+            return
+
+        remaining = []
+        for idx in self._image_turn_indices:
+            if len(self._dynamic_tail) - idx > self.keep_window:
+                # Build a new message; content parts may be shared with the caller
+                message = self._dynamic_tail[idx]
+                self._dynamic_tail[idx] = {
+                    **message,
+                    "content": [
+                        _IMAGE_OMITTED_PART if part.get("type") in _IMAGE_PART_TYPES else part
+                        for part in message["content"]
+                    ]
+                }
+                Logger.debug("Compacted images of message %d for persona '%s'", idx, self.name)
+            else:
+                remaining.append(idx)
+        self._image_turn_indices = remaining
     
     def print_message_history(self):
         """
@@ -156,7 +396,7 @@ class ActivePersona:
                     if item.get("type") == "text":
                         Logger.info(f"   Text: {item['text']}")
 
-                    elif item.get("type") == "image_url":
+                    elif item.get("type") in _IMAGE_PART_TYPES:
                         Logger.info(f"   Image: [Base64 encoded image]")
 
                     else:
@@ -1,11 +1,36 @@
 import csv
+import functools
 import pandas as pd
 import os
 import glob
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from scipy.stats import kruskal
 from .logger import Logger
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = pa_csv = None
+
+
+def _is_question_column(column) -> bool:
+    """Whether a column holds a questionnaire answer (q01, q02, ..., q99)."""
+    return isinstance(column, str) and column.startswith('q') and len(column) <= 3 and column[1:].isdigit()
+
+
+@functools.lru_cache(maxsize=32)
+def _find_question_columns(columns: tuple) -> tuple:
+    """Question columns sorted by number; cached per column layout."""
+    return tuple(sorted((col for col in columns if _is_question_column(col)), key=lambda col: int(col[1:])))
+
+
+def _question_columns(df: pd.DataFrame) -> list:
+    """Get the question columns of a DataFrame (e.g., ['q01', 'q02', ...])."""
+    return list(_find_question_columns(tuple(df.columns)))
+
 class DataAnalyzer:
     """
     A class for analyzing evaluation results data by merging CSV files and extracting statistical information.
@@ -27,8 +52,8 @@ class DataAnalyzer:
         
         Args:
             directory (str): Directory containing CSV evaluation files
-            stats_only (bool): If True, save only statistical columns (id, persona_name, model, q01-q20).
-                              If False, save all columns. Default: False
+            stats_only (bool): If True, load and save only statistical columns (id, persona_name, model, q01-q20).
+                              If False, load and save all columns. Default: False
         
         Returns:
             pd.DataFrame: Merged DataFrame with id, persona columns added
@@ -46,54 +71,41 @@ class DataAnalyzer:
         
         Logger.info(f"Found {len(file_list)} CSV files in {directory}")
         
-        # Load and merge all CSV files
-        dfs = []
-        for file_path in file_list:
-            try:
-                df = pd.read_csv(file_path, header=0, dtype=str)
-                Logger.debug(f"Loaded: {os.path.basename(file_path)} ({len(df)} rows)")
-                dfs.append(df)
-
-            except Exception as e:
-                Logger.error(f"Error loading {file_path}: {e}")
-                continue
+        # Load all CSV files concurrently; pandas releases the GIL while parsing.
+        # In stats-only mode only the columns needed for statistics are parsed.
+        usecols = self._is_stats_source_column if stats_only else None
+        read_csv = partial(self._read_evaluation_csv, usecols=usecols)
+        with ThreadPoolExecutor(max_workers=min(32, len(file_list))) as executor:
+            dfs = [df for df in executor.map(read_csv, file_list) if df is not None]
         
         if not dfs:
             Logger.error("No valid CSV files could be loaded")
             return pd.DataFrame()
         
         # Merge all DataFrames
-        merged_df = pd.concat(dfs, ignore_index=True)
+        merged_df = self._concat_frames(dfs)
         Logger.info(f"Merged {len(dfs)} files into DataFrame with {len(merged_df)} total rows")
         
         # Add 'id' column at the beginning
-        merged_df['id'] = [f"eval_{i+1}" for i in range(len(merged_df))]
+        merged_df['id'] = np.char.add('eval_', np.arange(1, len(merged_df) + 1).astype(str))
         
         # Extract 'persona' from 'persona_name' if it exists
-        if 'persona_name' in merged_df.columns:
-            merged_df['persona'] = merged_df['persona_name'].apply(
-                lambda x: str(x).split('_')[0] if pd.notnull(x) else ''
-            )
+        has_persona = 'persona_name' in merged_df.columns
+        if has_persona:
+            merged_df['persona'] = merged_df['persona_name'].str.split('_', n=1).str[0].fillna('')
 
             Logger.info(f"Extracted personas: {sorted(merged_df['persona'].unique())}")
         
         # Reorder columns: id first, then persona after persona_name
-        cols = merged_df.columns.tolist()
-        
-        # Move 'id' to first position
-        if 'id' in cols:
-            cols.insert(0, cols.pop(cols.index('id')))
-        
-        # Move 'persona' after 'persona_name'
-        if 'persona' in cols and 'persona_name' in cols:
-            persona_idx = cols.index('persona')
-            persona_name_idx = cols.index('persona_name')
-            # Remove 'persona' from current position
-            cols.pop(persona_idx)
-            # Insert 'persona' after 'persona_name'
-            cols.insert(persona_name_idx + 1, 'persona')
+        new_cols = ['id']
+        for col in merged_df.columns:
+            if col == 'id' or (has_persona and col == 'persona'):
+                continue
+            new_cols.append(col)
+            if has_persona and col == 'persona_name':
+                new_cols.append('persona')
         
-        merged_df = merged_df[cols]
+        merged_df = merged_df.reindex(columns=new_cols)
         
         # Save the merged DataFrame
         self._save_dataframe(merged_df, directory, stats_only)
@@ -101,6 +113,82 @@ class DataAnalyzer:
         Logger.info(f"Merge evaluations completed successfully")
         return merged_df
     
+    @staticmethod
+    def _concat_frames(dfs: list) -> pd.DataFrame:
+        """
+        Concatenate DataFrames row-wise with a single allocation per column.
+        
+        Evaluation files normally share the same schema; in that case each column is
+        concatenated directly, avoiding the intermediate blocks and consolidation of
+        pd.concat. Mismatching schemas fall back to pd.concat.
+        """
+        columns = dfs[0].columns
+        if not columns.is_unique or any(not df.columns.equals(columns) for df in dfs[1:]):
+            return pd.concat(dfs, ignore_index=True)
+        
+        data = {}
+        for col in columns:
+            if isinstance(dfs[0][col].dtype, np.dtype):
+                data[col] = np.concatenate([df[col].to_numpy() for df in dfs])
+            else:
+                # Extension (e.g. Arrow-backed string) columns keep their dtype
+                data[col] = pd.concat([df[col] for df in dfs], ignore_index=True)
+        return pd.DataFrame(data, columns=columns, copy=False)
+
+    @staticmethod
+    def _is_stats_source_column(column: str) -> bool:
+        """Whether a raw evaluation CSV column is needed to build the stats columns."""
+        return column in ('persona_name', 'model') or _is_question_column(column)
+
+    def _read_evaluation_csv(self, file_path: str, usecols=None):
+        """
+        Load a single evaluation CSV file as strings.
+        
+        Args:
+            file_path (str): Path to the CSV file
+            usecols: Optional column filter passed to pd.read_csv
+        
+        Returns:
+            pd.DataFrame or None: Loaded DataFrame, or None if loading failed
+        """
+        try:
+            df = None
+            if pa_csv is not None:
+                try:
+                    df = self._read_csv_pyarrow(file_path, usecols)
+                except pa.ArrowException as e:
+                    Logger.debug("Arrow could not parse %s, falling back to pandas: %s", file_path, e)
+            if df is None:
+                df = pd.read_csv(file_path, header=0, dtype=str, engine='c', low_memory=False, usecols=usecols)
+            Logger.debug("Loaded: %s (%d rows)", file_path, len(df))
+            return df
+
+        except Exception as e:
+            Logger.error(f"Error loading {file_path}: {e}")
+            return None
+    
+    def _read_csv_pyarrow(self, file_path: str, usecols=None) -> pd.DataFrame:
+        """
+        Load a CSV file with the multithreaded Arrow parser into Arrow-backed string columns.
+        
+        Every column is read as a string (like dtype=str with the C engine) so values
+        such as timestamps are kept verbatim instead of being inferred and reformatted.
+        """
+        with open(file_path, 'r', encoding='utf-8', newline='') as f:
+            columns = next(csv.reader(f), [])
+        if usecols is not None:
+            columns = [col for col in columns if usecols(col)]
+        
+        convert_options = pa_csv.ConvertOptions(
+            column_types={col: pa.string() for col in columns},
+            include_columns=columns,
+            strings_can_be_null=True
+        )
+        # Free-text answers may contain line breaks inside quoted values
+        parse_options = pa_csv.ParseOptions(newlines_in_values=True)
+        table = pa_csv.read_csv(file_path, parse_options=parse_options, convert_options=convert_options)
+        return table.to_pandas(types_mapper={pa.string(): pd.StringDtype('pyarrow')}.get)
+
     def perform_kruskal_wallis_analysis(self, df: pd.DataFrame, output_dir: str):
         """
         Performs Kruskal-Wallis H-test on the provided DataFrame to check for significant
@@ -118,13 +206,13 @@ class DataAnalyzer:
         Logger.debug(f"Created output directory: {output_dir}")
         
         # 1. Prepare data for analysis
-        df_analysis, question_columns = self._prepare_analysis_data(df)
-        if df_analysis is None:
+        persona_model, question_matrix, question_columns = self._prepare_analysis_data(df)
+        if persona_model is None:
             Logger.error("Failed to prepare analysis data")
             return None
             
         # 2. Run statistical tests
-        results_df = self._run_kruskal_wallis_tests(df_analysis, question_columns)
+        results_df = self._run_kruskal_wallis_tests(persona_model, question_matrix, question_columns)
         
         # 3. Save results to CSV file
         output_path = os.path.join(output_dir, 'kruskal_wallis_results.csv')
@@ -134,43 +222,77 @@ class DataAnalyzer:
         return results_df
 
     def _prepare_analysis_data(self, df: pd.DataFrame):
-        """Prepares the DataFrame for Kruskal-Wallis analysis."""
+        """
+        Prepares the data for Kruskal-Wallis analysis without copying the DataFrame.
+        
+        Returns:
+            tuple: (persona_model, question_matrix, question_columns) where persona_model
+                   is a Categorical with the group of each row and question_matrix is a float64 array
+                   with one column per question (NaN for missing or non-numeric answers),
+                   or (None, None, None) if the data cannot be analyzed
+        """
         Logger.debug("Preparing data for Kruskal-Wallis analysis")
         
         if not all(col in df.columns for col in ['persona', 'model']):
             Logger.error("Error: 'persona' and 'model' columns are required for this analysis")
-            return None, None
+            return None, None, None
             
-        df_analysis = df.copy()
-        df_analysis['persona_model'] = df_analysis['persona'] + '_' + df_analysis['model']
-        Logger.debug(f"Created persona_model combinations: {df_analysis['persona_model'].unique()}")
+        # Categorical labels: group membership becomes small integer codes
+        persona_model = pd.Categorical(df['persona'].astype(str) + '_' + df['model'].astype(str))
+        combinations = persona_model.categories
+        Logger.debug("Created persona_model combinations: %s", list(combinations))
         
-        question_columns = sorted([col for col in df_analysis.columns if col.startswith('q') and col[1:].isdigit()])
+        question_columns = _question_columns(df)
         if not question_columns:
             Logger.error("Error: No question columns (e.g., 'q01', 'q02') found for analysis")
-            return None, None
+            return None, None, None
             
-        for col in question_columns:
-            df_analysis[col] = pd.to_numeric(df_analysis[col], errors='coerce')
+        # Column-major so that each question is a contiguous array
+        question_matrix = np.asfortranarray(
+            df[question_columns].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+        )
             
-        Logger.info(f"Analyzing {len(question_columns)} questions across {len(df_analysis['persona_model'].unique())} groups.")
-        return df_analysis, question_columns
+        Logger.info(f"Analyzing {len(question_columns)} questions across {len(combinations)} groups.")
+        return persona_model, question_matrix, question_columns
 
-    def _run_kruskal_wallis_tests(self, df_analysis: pd.DataFrame, question_columns: list):
+    def _run_kruskal_wallis_tests(self, persona_model: pd.Categorical, question_matrix: np.ndarray, question_columns: list):
         """Runs the Kruskal-Wallis test for each question."""
         Logger.debug(f"Running Kruskal-Wallis tests for {len(question_columns)} questions")
         
+        # Row positions of each persona-model group, computed once for all questions
+        codes = persona_model.remove_unused_categories().codes
+        order = np.argsort(codes, kind='stable')
+        groups_idx = np.split(order, np.cumsum(np.bincount(codes))[:-1])
+        
         results = {}
-        for question in question_columns:
-            groups = [df_analysis[question].dropna()[df_analysis['persona_model'] == group] for group in df_analysis['persona_model'].unique()]
+        for col, question in enumerate(question_columns):
+            values = question_matrix[:, col]
+            groups = []
+            for idx in groups_idx:
+                group_values = values.take(idx)
+                groups.append(group_values[~np.isnan(group_values)])
+            
+            # Cheap pre-checks for cases kruskal rejects: too few groups or samples,
+            # or all values identical
+            sizes = [len(group) for group in groups]
+            if len(groups) < 2 or min(sizes) == 0 or sum(sizes) < 2:
+                results[question] = {'hstat': np.nan, 'pvalue': 1.0}
+                Logger.debug("Question %s: Insufficient data", question)
+                continue
+            
+            all_values = np.concatenate(groups)
+            if all_values.min() == all_values.max():
+                results[question] = {'hstat': np.nan, 'pvalue': 1.0}
+                Logger.debug("Question %s: All values identical", question)
+                continue
             
             try:
                 h_stat, p_value = kruskal(*groups)
-                Logger.debug(f"Question {question}: H-stat={h_stat:.4f}, p-value={p_value:.6f}")
+                Logger.debug("Question %s: H-stat=%.4f, p-value=%.6f", question, h_stat, p_value)
             except ValueError as e:
                 if 'All numbers are identical' in str(e) or 'must contain at least one dimension' in str(e):
                     h_stat, p_value = np.nan, 1.0
-                    Logger.debug(f"Question {question}: All values identical or insufficient data")
+                    Logger.debug("Question %s: All values identical or insufficient data", question)
                 else:
                     Logger.error(f"Error in Kruskal-Wallis test for {question}: {e}")
                     raise e
@@ -200,33 +322,47 @@ class DataAnalyzer:
         
         Logger.debug(f"Created stats directory: {stats_dir}")
         
-        if stats_only:
-            # Save only statistical columns
-            stats_columns = self._get_stats_columns(df)
-            df_stats = df[stats_columns]
-            
-            output_path = os.path.join(stats_dir, f"_stats_{self.output_prefix}_evaluation_results.csv")
-            df_stats.to_csv(output_path, index=False, quotechar='"', quoting=csv.QUOTE_ALL)
-            
-            Logger.info(f"Saved stats-only DataFrame to: {output_path}")
-            Logger.debug(f"Stats DataFrame shape: {df_stats.shape}")
-            
-        else:
+        # Statistical columns are identified once and shared by both outputs
+        stats_columns = self._get_stats_columns(df)
+        df_stats = df[stats_columns]
+        
+        if not stats_only:
             # Save full DataFrame
             full_output_path = os.path.join(stats_dir, f"_{self.output_prefix}_evaluation_results.csv")
-            df.to_csv(full_output_path, index=False, quotechar='"', quoting=csv.QUOTE_ALL)
+            self._write_csv(df, full_output_path)
             
             Logger.info(f"Saved full DataFrame to: {full_output_path}")
-            
-            # Also save stats version
-            stats_columns = self._get_stats_columns(df)
-            df_stats = df[stats_columns]
-            stats_output_path = os.path.join(stats_dir, f"_stats_{self.output_prefix}_evaluation_results.csv")
-            df_stats.to_csv(stats_output_path, index=False, quotechar='"', quoting=csv.QUOTE_ALL)
-            
-            Logger.info(f"Saved stats DataFrame to: {stats_output_path}")
-            Logger.debug(f"Full DataFrame shape: {df.shape}, Stats DataFrame shape: {df_stats.shape}")
+        
+        # Save statistical columns
+        stats_output_path = os.path.join(stats_dir, f"_stats_{self.output_prefix}_evaluation_results.csv")
+        self._write_csv(df_stats, stats_output_path)
+        
+        Logger.info(f"Saved stats DataFrame to: {stats_output_path}")
+        Logger.debug(f"Full DataFrame shape: {df.shape}, Stats DataFrame shape: {df_stats.shape}")
     
+    def _write_csv(self, df: pd.DataFrame, output_path: str):
+        """
+        Write a DataFrame to CSV with all values quoted.
+        
+        Uses the multithreaded Arrow CSV writer when pyarrow is available and falls back
+        to pandas with a large write buffer otherwise. Missing values are left unquoted
+        by the Arrow writer.
+        
+        Args:
+            df (pd.DataFrame): DataFrame to write
+            output_path (str): Path of the CSV file
+        """
+        if pa_csv is not None:
+            try:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                pa_csv.write_csv(table, output_path, write_options=pa_csv.WriteOptions(quoting_style='all_valid'))
+                return
+            except pa.ArrowException as e:
+                Logger.debug("Arrow CSV writer failed for %s, falling back to pandas: %s", output_path, e)
+        
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+            df.to_csv(f, index=False, quotechar='"', quoting=csv.QUOTE_ALL)
+
     def _get_stats_columns(self, df: pd.DataFrame) -> list:
         """
         Get columns needed for statistical analysis.
@@ -245,8 +381,7 @@ class DataAnalyzer:
             base_columns.append('model')
         
         # Add question columns (q01, q02, ..., q20)
-        question_columns = [col for col in df.columns if col.startswith('q') and len(col) <= 3 and col[1:].isdigit()]
-        question_columns = sorted(question_columns, key=lambda x: int(x[1:]))
+        question_columns = _question_columns(df)
         
         # Combine all columns that exist in the DataFrame
         stats_columns = [col for col in base_columns + question_columns if col in df.columns]
@@ -273,7 +408,7 @@ class DataAnalyzer:
             'personas': sorted(df['persona'].unique()) if 'persona' in df.columns else [],
             'unique_models': len(df['model'].unique()) if 'model' in df.columns else 0,
             'models': sorted(df['model'].unique()) if 'model' in df.columns else [],
-            'question_columns': [col for col in df.columns if col.startswith('q') and len(col) <= 3 and col[1:].isdigit()]
+            'question_columns': _question_columns(df)
         }
         
         Logger.debug(f"Summary stats: {stats['total_rows']} rows, {stats['total_columns']} columns")
@@ -1,12 +1,22 @@
+import asyncio
+import csv
 import json
 import os
-import pandas as pd
-import re
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from .active_persona import ActivePersona
 from .logger import Logger
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_JSON_DECODER = json.JSONDecoder()
 
 class EvaluatorBase(ABC):
     """
@@ -14,35 +24,87 @@ class EvaluatorBase(ABC):
     Handles loading materials, setting images, preparing messages, running and saving evaluations.
     """
 
-    def __init__(self, evaluation_prompt: str, auto_reset: bool = True):
+    def __init__(self, evaluation_prompt: str, auto_reset: bool = True, provider_concurrency: int = 4):
+        """
+        Args:
+            evaluation_prompt (str): The evaluation questionnaire
+            auto_reset (bool): Reset the persona's history before each iteration (default: True)
+            provider_concurrency (int): Maximum number of requests in flight per provider, across
+                                        all asynchronous evaluations run with this evaluator (default: 4)
+        """
         self.evaluation_prompt = evaluation_prompt
         self.auto_reset = auto_reset
+        self.provider_concurrency = max(1, provider_concurrency)
         self.images_paths = []
+        self._image_records = []
+        self._static_messages = self._build_static_messages()
+        # Processed evaluation messages per LLM client (see _get_processed_prefix)
+        self._processed_prefixes = {}
+        # Semaphores limiting concurrent requests per provider (see _provider_semaphore)
+        self._provider_semaphores = {}
+        self._provider_semaphores_loop = None
+
+    def set_images(self, images: List[Union[str, dict]]):
+        """
+        Set the images shown to the persona.
+        
+        Accepts image paths or records returned by preload_images; preloaded
+        records are reused as-is so the files are never re-read or re-encoded.
+        Paths are validated and canonicalized once here, and the evaluation
+        messages are prebuilt so that preparing an evaluation is constant time.
+        
+        Raises:
+            FileNotFoundError: If any of the images does not exist
+        """
+        records = []
+        try:
+            for image in images:
+                if isinstance(image, dict):
+                    records.append(image)
+                else:
+                    path = os.path.abspath(os.fspath(image))
+                    os.stat(path)
+                    records.append({"type": "image", "path": path})
+        except FileNotFoundError as e:
+            Logger.error(f"Image not found: {e.filename}")
+            raise
+
+        self.images_paths = [record["path"] for record in records]
+        self._image_records = records
+        self._static_messages = self._build_static_messages()
+        self._processed_prefixes = {}
 
-    def set_images(self, images_paths: List[str]):
-        self.images_paths = images_paths
+    def _build_static_messages(self) -> list:
+        """
+        Build the questionnaire text followed by all images.
+        """
+        messages = [{"type": "text", "text": self.evaluation_prompt}]
+        messages.extend(self._image_records)
+        return messages
 
-    def _prepare_evaluation_messages(self) -> list:
+    def _prepare_evaluation_messages(self) -> Tuple[list, int]:
         """
         Prepare the messages for persona evaluation.
         
         Returns:
-            list: Formatted messages including questionnaire and images
+            tuple: Formatted messages including questionnaire and images, and the
+                   index of the last message of this static prefix (cache breakpoint)
         """
-        
-        # Start with the questionnaire text
-        messages = []
+        return self._static_messages, len(self._static_messages) - 1
 
-        messages.append({"type": "text", "text": self.evaluation_prompt})
+    def _get_processed_prefix(self, active_persona: ActivePersona) -> Tuple[list, int]:
+        """
+        Return the processed (text and encoded image) evaluation messages.
         
-        # Add all images
-        for image_path in self.images_paths:
-            if os.path.exists(image_path):
-                messages.append({"type": "image", "path": image_path})
-            else:
-                Logger.error(f"Warning: Image not found: {image_path}")
-
-        return messages
+        How images are sent (URL or base64) depends on the LLM client,
+        so they are built once per client and reused for every iteration and persona of
+        that client; keeping them byte-identical also preserves provider prompt caching.
+        """
+        llm_client = active_persona.llm_client
+        if llm_client not in self._processed_prefixes:
+            messages, cache_breakpoint = self._prepare_evaluation_messages()
+            self._processed_prefixes[llm_client] = (active_persona.process_messages(messages), cache_breakpoint)
+        return self._processed_prefixes[llm_client]
 
     def _preprocess_entry(self, entry: dict) -> dict:
         """
@@ -52,102 +114,370 @@ class EvaluatorBase(ABC):
         """
         return entry
 
-    def evaluate(self, active_persona: ActivePersona, iterations: int = 1) -> Dict[str, Any]:
+    def _run_iteration(
+            self, 
+            active_persona: ActivePersona, 
+            messages: list, 
+            cache_breakpoint: int, 
+            entry_template: Dict[str, Any], 
+            iteration: int, 
+            iterations: int,
+            on_iter_done: Optional[Callable[[int, float], None]] = None
+        ) -> Optional[Dict[str, Any]]:
         """
-        Conduct SUS evaluation using the provided persona.
-        Args:
-            persona (Persona): The persona to conduct the evaluation
-            iterations (int): Number of evaluation iterations to run (default: 1)
+        Run a single evaluation iteration.
+        on_iter_done, if given, is called with the iteration number and its duration in ms.
         Returns:
-            Dict[str, Any]: JSON object containing evaluation results
+            Dict[str, Any] or None: The evaluation entry, or None if the iteration failed
         """
+        start_ns = time.perf_counter_ns()
+        try:
+            Logger.info(f"-- iteration {iteration}/{iterations}")
 
-        if iterations < 1:
-            iterations = 1
+            if self.auto_reset:
+                active_persona.reset_history()
 
-        messages = self._prepare_evaluation_messages()
-        evaluation_results = []
+            response = active_persona.interact(messages, cache_breakpoint=cache_breakpoint)
+            return self._build_entry(response, entry_template, iteration)
+            
+        except Exception as e:
+            Logger.error(f"-- iteration {iteration} failed: {e}")
+            #print(f"Response content: {response_json}")
+            return None
+        finally:
+            if on_iter_done is not None:
+                on_iter_done(iteration, (time.perf_counter_ns() - start_ns) / 1e6)
 
-        entry_template = {
+    async def _arun_iteration(
+            self, 
+            active_persona: ActivePersona, 
+            messages: list, 
+            cache_breakpoint: int, 
+            entry_template: Dict[str, Any], 
+            iteration: int, 
+            iterations: int,
+            semaphore: asyncio.Semaphore,
+            provider_semaphore: asyncio.Semaphore,
+            on_iter_done: Optional[Callable[[int, float], None]] = None
+        ) -> Optional[Dict[str, Any]]:
+        """
+        Run a single evaluation iteration asynchronously, once both the evaluation's and
+        the provider's semaphores are acquired.
+        on_iter_done, if given, is called with the iteration number and its duration in ms
+        (excluding the wait for the semaphores).
+        Returns:
+            Dict[str, Any] or None: The evaluation entry, or None if the iteration failed
+        """
+        async with semaphore, provider_semaphore:
+            start_ns = time.perf_counter_ns()
+            try:
+                Logger.info(f"-- iteration {iteration}/{iterations}")
+
+                if self.auto_reset:
+                    active_persona.reset_history()
+
+                response = await active_persona.ainteract(messages, cache_breakpoint=cache_breakpoint)
+                return self._build_entry(response, entry_template, iteration)
+
+            except Exception as e:
+                Logger.error(f"-- iteration {iteration} failed: {e}")
+                return None
+            finally:
+                if on_iter_done is not None:
+                    on_iter_done(iteration, (time.perf_counter_ns() - start_ns) / 1e6)
+
+    def _build_entry(self, response: str, entry_template: Dict[str, Any], iteration: int) -> Dict[str, Any]:
+        """
+        Parse the LLM response and merge it into a copy of the entry template.
+        """
+        Logger.debug("Response: %s", response)
+        
+        response_json = self._parse_json(response)
+
+        #print(response_json)
+
+        processed_entry = self._preprocess_entry(response_json)
+
+        entry = entry_template.copy()
+        entry.update(processed_entry)
+
+        Logger.info(f"-- iteration {iteration} completed successfully")
+        return entry
+
+    def _entry_template(self, active_persona: ActivePersona) -> Dict[str, Any]:
+        """
+        Build the metadata shared by all entries of one evaluation run.
+        """
+        return {
             "timestamp": datetime.now().isoformat(),
             "persona_name": getattr(active_persona, 'name', 'Unknown'),
             "model": getattr(active_persona.llm_client, 'model_name', 'Unknown'),
         }
 
+    def evaluate(
+            self, 
+            active_persona: ActivePersona, 
+            iterations: int = 1, 
+            concurrency: int = 1,
+            on_iter_done: Optional[Callable[[int, float], None]] = None
+        ) -> Iterator[Dict[str, Any]]:
+        """
+        Conduct the evaluation using the provided persona.
+        Entries are yielded in iteration order as each iteration completes; failed iterations are skipped.
+        Args:
+            persona (Persona): The persona to conduct the evaluation
+            iterations (int): Number of evaluation iterations to run (default: 1)
+            concurrency (int): Maximum number of iterations run in parallel (default: 1).
+                               Only used with auto_reset, where iterations are independent.
+            on_iter_done (callable): Called with the iteration number and its duration in ms
+                                     after each iteration, including failed ones (default: None)
+        Yields:
+            Dict[str, Any]: JSON object containing the results of one iteration
+        """
+
+        if iterations < 1:
+            iterations = 1
+
+        messages, cache_breakpoint = self._get_processed_prefix(active_persona)
+        entry_template = self._entry_template(active_persona)
+
         Logger.info(f"Running {self.__class__.__name__}")
-        for iteration in range(1, iterations + 1):
-            try:
-                Logger.info(f"-- iteration {iteration}/{iterations}")
+        if concurrency > 1 and self.auto_reset and iterations > 1:
+            workers = min(concurrency, iterations)
+            Logger.info(f"Running {iterations} iterations with concurrency {workers}")
 
-                if self.auto_reset:
-                    active_persona.reset_history()
+            # Each worker borrows its own clone so message histories never interleave
+            personas = queue.SimpleQueue()
+            for _ in range(workers):
+                personas.put(active_persona._clone())
+
+            def run(iteration: int) -> Optional[Dict[str, Any]]:
+                persona = personas.get()
+                try:
+                    return self._run_iteration(persona, messages, cache_breakpoint, entry_template, iteration, iterations,
+                                               on_iter_done)
+                finally:
+                    personas.put(persona)
 
-                response = active_persona.interact(messages)
-                Logger.debug(f"Response: {response}")
-                
-                response_json = json.loads(
-                    self._extract_json(response)
-                )
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for entry in executor.map(run, range(1, iterations + 1)):
+                    if entry is not None:
+                        yield entry
+        else:
+            for iteration in range(1, iterations + 1):
+                entry = self._run_iteration(active_persona, messages, cache_breakpoint, entry_template, iteration, iterations,
+                                            on_iter_done)
+                if entry is not None:
+                    yield entry
 
-                #print(response_json)
+        Logger.info(f"{self.__class__.__name__} completed")
+
+    def _provider_semaphore(self, active_persona: ActivePersona) -> asyncio.Semaphore:
+        """
+        Get the semaphore shared by all concurrent evaluations against the persona's provider.
+        
+        Semaphores are keyed by the client's base URL and sized by provider_concurrency;
+        they are recreated for each event loop, since they cannot be shared across loops.
+        """
+        loop = asyncio.get_running_loop()
+        if self._provider_semaphores_loop is not loop:
+            self._provider_semaphores = {}
+            self._provider_semaphores_loop = loop
+        
+        provider = getattr(active_persona.llm_client, 'base_url', None)
+        if provider not in self._provider_semaphores:
+            self._provider_semaphores[provider] = asyncio.Semaphore(self.provider_concurrency)
+        return self._provider_semaphores[provider]
 
-                processed_entry = self._preprocess_entry(response_json)
+    async def aevaluate(
+            self, 
+            active_persona: ActivePersona, 
+            iterations: int = 1, 
+            max_concurrency: int = 1,
+            on_iter_done: Optional[Callable[[int, float], None]] = None
+        ) -> List[Dict[str, Any]]:
+        """
+        Conduct the evaluation asynchronously, running the iterations with asyncio.gather.
+        Iterations only overlap with auto_reset, where they are independent; each then runs
+        on its own clone of the persona. Failed iterations are skipped.
+        
+        Requests are also limited per provider (provider_concurrency), across all evaluations
+        running concurrently with this evaluator, to respect the provider's rate limits.
+        Args:
+            active_persona (ActivePersona): The persona to conduct the evaluation
+            iterations (int): Number of evaluation iterations to run (default: 1)
+            max_concurrency (int): Maximum number of this evaluation's requests in flight (default: 1)
+            on_iter_done (callable): Called with the iteration number and its duration in ms
+                                     after each iteration, including failed ones (default: None)
+        Returns:
+            List[Dict[str, Any]]: Evaluation entries, in iteration order
+        """
+        if iterations < 1:
+            iterations = 1
 
-                entry = entry_template.copy()
-                entry.update(processed_entry)
+        messages, cache_breakpoint = self._get_processed_prefix(active_persona)
+        entry_template = self._entry_template(active_persona)
 
-                evaluation_results.append(entry)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        provider_semaphore = self._provider_semaphore(active_persona)
 
-                Logger.info(f"-- iteration {iteration} completed successfully")
-                
-            except Exception as e:
-                Logger.error(f"-- iteration {iteration} failed: {e}")
-                #print(f"Response content: {response_json}")
+        Logger.info(f"Running {self.__class__.__name__}")
+        if self.auto_reset and iterations > 1:
+            Logger.info(f"Running {iterations} iterations with max concurrency {max_concurrency}")
+            entries = await asyncio.gather(*(
+                self._arun_iteration(active_persona._clone(), messages, cache_breakpoint, entry_template,
+                                     iteration, iterations, semaphore, provider_semaphore, on_iter_done)
+                for iteration in range(1, iterations + 1)
+            ))
+        else:
+            # Iterations build on the shared history, so they must run one at a time
+            entries = []
+            for iteration in range(1, iterations + 1):
+                entries.append(await self._arun_iteration(active_persona, messages, cache_breakpoint, entry_template,
+                                                          iteration, iterations, semaphore, provider_semaphore, on_iter_done))
 
         Logger.info(f"{self.__class__.__name__} completed")
-        
-        return evaluation_results
+        return [entry for entry in entries if entry is not None]
 
-    def evaluate_and_save(self, active_persona: ActivePersona, iterations: int = 1, save_in: str = None) -> Any:
-        evaluation_results = self.evaluate(active_persona, iterations)
+    def evaluate_and_save(
+            self, 
+            active_persona: ActivePersona, 
+            iterations: int = 1, 
+            save_in: str = None, 
+            return_results: bool = True,
+            concurrency: int = 1,
+            on_iter_done: Optional[Callable[[int, float], None]] = None
+        ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Run the evaluation and stream each entry to a CSV file as it completes.
+        Args:
+            active_persona (ActivePersona): The persona to conduct the evaluation
+            iterations (int): Number of evaluation iterations to run (default: 1)
+            save_in (str): Directory where to save the results (results are only returned if None)
+            return_results (bool): Whether to also collect and return the entries (default: True)
+            concurrency (int): Maximum number of iterations run in parallel (default: 1)
+            on_iter_done (callable): Called with the iteration number and its duration in ms
+                                     after each iteration (default: None)
+        Returns:
+            List[Dict[str, Any]] or None: Evaluation entries, if return_results is True
+        """
+        entries = self.evaluate(active_persona, iterations, concurrency, on_iter_done)
+        if save_in is None:
+            return list(entries)
+        return self._save_entries(active_persona, entries, save_in, return_results)
 
+    async def evaluate_and_save_async(
+            self, 
+            active_persona: ActivePersona, 
+            iterations: int = 1, 
+            save_in: str = None, 
+            return_results: bool = True,
+            concurrency: int = 1,
+            on_iter_done: Optional[Callable[[int, float], None]] = None
+        ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Run the evaluation asynchronously (see aevaluate) and save the entries to a CSV file.
+        Args:
+            active_persona (ActivePersona): The persona to conduct the evaluation
+            iterations (int): Number of evaluation iterations to run (default: 1)
+            save_in (str): Directory where to save the results (results are only returned if None)
+            return_results (bool): Whether to also return the entries (default: True)
+            concurrency (int): Maximum number of iterations run in parallel (default: 1)
+            on_iter_done (callable): Called with the iteration number and its duration in ms
+                                     after each iteration (default: None)
+        Returns:
+            List[Dict[str, Any]] or None: Evaluation entries, if return_results is True
+        """
+        entries = await self.aevaluate(active_persona, iterations, concurrency, on_iter_done)
         if save_in is None:
-            return evaluation_results
+            return entries
+        return self._save_entries(active_persona, entries, save_in, return_results)
+
+    def _save_entries(
+            self, 
+            active_persona: ActivePersona, 
+            entries: Iterable[Dict[str, Any]], 
+            save_in: str, 
+            return_results: bool = True
+        ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Write the entries to the persona's CSV file in save_in through a single file handle.
         
+        The header is the union of the fields of all entries, in first-seen order; an
+        entry bringing new fields rewrites the file under the extended header.
+        Streamed entries are flushed as they are produced; an already gathered list
+        (concurrent iterations) is written in one pass without per-row flushes.
+        Returns:
+            List[Dict[str, Any]] or None: The written entries, if return_results is True
+        """
         persona_name = getattr(active_persona, 'name', 'Unknown')
         pre_path = f"{save_in}/{persona_name}_{self.__class__.__name__.lower()}_evaluation_results"
         csv_path = f"{pre_path}.csv"
 
-        df = pd.DataFrame(evaluation_results)
-        
-        df.to_csv(csv_path, index=False, encoding='utf-8')
+        written_entries = []
+        fieldnames = {}
+        streamed = not isinstance(entries, list)
+
+        with open(csv_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+            writer = None
+            for entry in entries:
+                new_fields = [field for field in entry if field not in fieldnames]
+                if new_fields:
+                    fieldnames.update(dict.fromkeys(new_fields))
+                    if writer is not None:
+                        Logger.debug("Extending CSV header with %s: %s", new_fields, csv_path)
+                        csvfile.seek(0)
+                        csvfile.truncate()
+                    writer = csv.DictWriter(csvfile, fieldnames=list(fieldnames))
+                    writer.writeheader()
+                    writer.writerows(written_entries)
+
+                writer.writerow(entry)
+                written_entries.append(entry)
+                # Flush per streamed entry so completed iterations survive an interrupted run
+                if streamed:
+                    csvfile.flush()
 
         Logger.info(f"{self.__class__.__name__} saved to {csv_path}")
 
-        return evaluation_results
+        return written_entries if return_results else None
 
-    def _extract_json(self, text: str) -> str:
+    def _parse_json(self, text: str) -> dict:
         """
-        Extract the JSON part from a string that may contain extra text before or after the JSON.
-        Returns the JSON substring, or raises ValueError if not found.
+        Parse the JSON object from a string that may contain extra text before or after the JSON.
+        Returns the parsed object, or raises ValueError if not found.
         """
         
-        # Find the first curly brace and try to parse from there
-        match = re.search(r'({.*)', text, re.DOTALL)
-        if not match:
+        # Fast path: responses in JSON mode are already a bare object
+        stripped = text.strip()
+        if orjson is not None and stripped.startswith('{') and stripped.endswith('}'):
+            try:
+                return orjson.loads(stripped)
+            except orjson.JSONDecodeError:
+                pass
+        if stripped.startswith('{'):
+            try:
+                return _JSON_DECODER.raw_decode(stripped, 0)[0]
+            except json.JSONDecodeError:
+                pass
+        
+        # Decode from the first curly brace; raw_decode stops at the end of the
+        # object and ignores any trailing text
+        idx = text.find('{')
+        if idx < 0:
             raise ValueError("No JSON object found in text")
         
-        json_part = match.group(1)
-        # Try to find the matching closing brace for the JSON object
-        # This is a simple approach, assumes no nested objects with unmatched braces
-        stack = []
-        for i, c in enumerate(json_part):
-            if c == '{':
-                stack.append(i)
-            elif c == '}':
-                stack.pop()
-                if not stack:
-                    return json_part[:i+1]
-
+        while idx >= 0:
+            try:
+                return _JSON_DECODER.raw_decode(text, idx)[0]
+            except json.JSONDecodeError as e:
+                error = e
+                # Only a brace that does not even open a key (e.g. "{braces}" in prose)
+                # is skipped; an object failing further in is malformed, and retrying
+                # inside it could return one of its nested objects
+                if text[idx + 1:e.pos].strip() or text.startswith('{', e.pos):
+                    break
+                idx = text.find('{', e.pos)
+        
         Logger.error(f"Could not extract complete JSON object. Response content: {text}")
-        raise ValueError("Could not extract complete JSON object")
+        raise ValueError(f"Could not extract complete JSON object: {error}") from error
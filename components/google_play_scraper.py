@@ -1,10 +1,119 @@
 import csv
+import heapq
 import os
+import time
+import xxhash
+from collections import namedtuple
+from operator import attrgetter
 from datetime import datetime
 from urllib.parse import urlparse, parse_qs
-from google_play_scraper import app, reviews, reviews_all, Sort
+from google_play_scraper import app, reviews, Sort
 from .logger import Logger
 
+# Columns of the reviews CSV files, in order
+REVIEW_FIELDS = ('app_id', 'app_name', 'reviewer', 'rating', 'review_text',
+                 'review_date', 'thumbs_up', 'reply_text', 'scraped_at')
+
+# A review row; a plain tuple so CSV rows are read and written positionally
+Review = namedtuple('Review', REVIEW_FIELDS)
+
+# Sort key of the reviews CSV files (newest first)
+_scraped_at_key = attrgetter('scraped_at')
+
+
+def _review_fingerprint(reviewer, review_text) -> int:
+    """
+    64-bit fingerprint of a review used for duplicate detection.
+    
+    Storing an int instead of the reviewer and full review text keeps the
+    duplicate set small; the unit separator prevents concatenation collisions.
+    """
+    data = f"{reviewer or ''}\x1f{review_text or ''}".encode('utf-8', 'surrogatepass')
+    return xxhash.xxh3_64_intdigest(data)
+
+
+# Reviews requested from Google Play per page
+_REVIEWS_PAGE_SIZE = 200
+
+# Retries of a throttled or failed reviews page, with exponential backoff
+_FETCH_MAX_ATTEMPTS = 5
+_BACKOFF_INITIAL_SECONDS = 1.0
+_BACKOFF_MAX_SECONDS = 30.0
+# Retries of an empty page without continuation token, which usually is the end of the reviews
+_EMPTY_PAGE_RETRIES = 1
+
+
+class _TokenBucket:
+    """
+    Token bucket pacing requests to `rate` per second, allowing bursts of up to `capacity`.
+    """
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def acquire(self):
+        """Take a token, sleeping until one is available."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens < 1:
+            time.sleep((1 - self.tokens) / self.rate)
+            self.tokens = 1
+            self.updated = time.monotonic()
+        self.tokens -= 1
+
+
+# Format of the review_date column
+_REVIEW_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def _review_row(review, app_id, app_name, scraped_at):
+    """
+    Convert a review dict returned by google_play_scraper into a Review row.
+    """
+    get = review.get
+    at = get('at')
+    return Review(
+        app_id,
+        app_name,
+        get('userName', 'Anonymous'),
+        get('score', 'N/A'),
+        get('content', ''),
+        at.strftime(_REVIEW_DATE_FORMAT) if at else '',
+        get('thumbsUpCount') or 0,
+        get('replyContent', ''),
+        scraped_at
+    )
+
+
+# MinHash-LSH parameters for near-duplicate review detection
+_NEAR_DUP_THRESHOLD = 0.87
+_NEAR_DUP_NUM_PERM = 128
+_NEAR_DUP_SHINGLE_SIZE = 5
+
+
+def _review_minhash(review_text):
+    """
+    MinHash of the word 5-gram shingles of a review text.
+    
+    Returns None for texts without words: rating-only reviews would otherwise
+    all be near duplicates of each other.
+    """
+    from datasketch import MinHash
+
+    tokens = (review_text or '').lower().split()
+    if not tokens:
+        return None
+    
+    shingle_count = max(1, len(tokens) - _NEAR_DUP_SHINGLE_SIZE + 1)
+    shingles = {' '.join(tokens[i:i + _NEAR_DUP_SHINGLE_SIZE]) for i in range(shingle_count)}
+    
+    minhash = MinHash(num_perm=_NEAR_DUP_NUM_PERM)
+    minhash.update_batch([shingle.encode('utf-8') for shingle in shingles])
+    return minhash
+
 class GooglePlayScraper:
     """
     Google Play Store data collection service for UX research.
@@ -35,8 +144,18 @@ class GooglePlayScraper:
     - Identify common usability issues and pain points
     - Support competitive UX analysis workflows
     """
-    def __init__(self, output_dir="data/user_feedback"):
+    def __init__(self, output_dir="data/user_feedback", ttl_seconds=None):
+        """
+        Args:
+            output_dir (str): Directory of the reviews CSV files
+            ttl_seconds (float or None): Apps whose CSV file was written less than this many
+                         seconds ago are not scraped again, whatever the scrape parameters
+                         (lang, country, sort order, max reviews) were (default None: always scrape)
+        """
         self.output_dir = output_dir
+        self.ttl_seconds = ttl_seconds
+        # Number of CSV files in output_dir, computed on first use (see get_review_count)
+        self._count_cache = None
         # Create output directory if it doesn't exist
         os.makedirs(self.output_dir, exist_ok=True)
         Logger.debug(f"GooglePlayScraper initialized with output directory: {self.output_dir}")
@@ -53,7 +172,7 @@ class GooglePlayScraper:
                 query_params = parse_qs(parsed_url.query)
                 app_id = query_params.get('id', [None])[0]
                 if app_id:
-                    Logger.debug(f"Extracted app ID: {app_id}")
+                    Logger.debug("Extracted app ID: %s", app_id)
                     return app_id
             
             raise ValueError("Could not extract app ID from URL")
@@ -61,12 +180,30 @@ class GooglePlayScraper:
             Logger.error(f"Invalid URL format: {e}")
             raise ValueError(f"Invalid URL format: {e}")
     
+    def get_cached_csv(self, app_id):
+        """
+        Get the reviews CSV file of an app without scraping
+        
+        Returns:
+            str or None: Path to the app's CSV file, or None if there is none or it is
+                         older than ttl_seconds (any existing file when ttl_seconds is None)
+        """
+        csv_path = os.path.join(self.output_dir, f"{app_id}.csv")
+        try:
+            age = time.time() - os.stat(csv_path).st_mtime
+        except FileNotFoundError:
+            return None
+        if self.ttl_seconds and age >= self.ttl_seconds:
+            Logger.debug("Reviews file is %.0fs old, past the TTL: %s", age, csv_path)
+            return None
+        return csv_path
+    
     def get_existing_reviews(self, app_id):
         """
         Get existing reviews from CSV file if it exists
         
         Returns:
-            tuple: (existing_reviews_list, csv_path)
+            tuple: (existing_reviews_list, csv_path) with reviews as Review tuples
         """
         csv_filename = f"{app_id}.csv"
         csv_path = os.path.join(self.output_dir, csv_filename)
@@ -74,55 +211,166 @@ class GooglePlayScraper:
         
         if os.path.exists(csv_path):
             try:
-                with open(csv_path, 'r', encoding='utf-8') as csvfile:
-                    reader = csv.DictReader(csvfile)
-                    existing_reviews = list(reader)
+                with open(csv_path, 'r', encoding='utf-8', newline='', buffering=1 << 20) as csvfile:
+                    reader = csv.reader(csvfile)
+                    header = next(reader, None)
+                    if header is not None:
+                        existing_reviews = self._read_review_rows(reader, header)
+                # Files are written newest first; sort the ones that are not (e.g. edited by hand)
+                if any(a.scraped_at < b.scraped_at for a, b in zip(existing_reviews, existing_reviews[1:])):
+                    Logger.info(f"Sorting existing reviews by scraped_at: {csv_path}")
+                    existing_reviews.sort(key=_scraped_at_key, reverse=True)
                 Logger.info(f"Found existing reviews file with {len(existing_reviews)} reviews: {csv_path}")
             except Exception as e:
                 Logger.error(f"Error reading existing file: {e}")
         else:
-            Logger.debug(f"No existing reviews file found: {csv_path}")
+            Logger.debug("No existing reviews file found: %s", csv_path)
         
         return existing_reviews, csv_path
     
-    def merge_reviews(self, existing_reviews, new_reviews):
+    def _read_review_rows(self, reader, header):
+        """
+        Convert CSV rows into Review tuples.
+        
+        Rows of files written with the current column layout are used as they are;
+        files with another column order or missing columns are remapped by name.
+        Blank lines are skipped.
+        """
+        width = len(REVIEW_FIELDS)
+        if tuple(header) == REVIEW_FIELDS:
+            return [
+                Review._make(row if len(row) == width else (row + [''] * width)[:width])
+                for row in reader if row
+            ]
+        
+        Logger.debug("Remapping reviews CSV columns: %s", header)
+        positions = [header.index(field) if field in header else None for field in REVIEW_FIELDS]
+        return [
+            Review._make(row[pos] if pos is not None and pos < len(row) else '' for pos in positions)
+            for row in reader if row
+        ]
+
+    def get_review_fingerprints(self, reviews_list):
+        """
+        Build the set of fingerprints (reviewer + review_text) of the given reviews
+        
+        Returns:
+            set[int]: Fingerprints used for duplicate detection
+        """
+        return {_review_fingerprint(review.reviewer, review.review_text) for review in reviews_list}
+
+    def merge_reviews(self, existing_reviews, new_reviews, dedup='exact', existing_identifiers=None):
         """
         Merge new reviews with existing ones, avoiding duplicates
         and ordering from newest to oldest
         
-        Returns:
-            list: Merged reviews ordered by scraped_at (newest first)
+        New reviews are consumed lazily and de-duplicated on the fly, then merged
+        in linear time with the existing ones; both are already sorted newest first.
+        
+        Args:
+            existing_reviews (list): Reviews already stored in the CSV file (Review tuples)
+            new_reviews (iterable): Newly scraped reviews (Review tuples)
+            dedup (str): 'exact' to drop reviews with the same reviewer and text, or
+                         'near' to additionally drop reviews whose text is a near
+                         duplicate (MinHash-LSH, Jaccard >= 0.87 over word 5-grams)
+            existing_identifiers (set or None): Fingerprints of the existing reviews, if
+                         already built (see get_review_fingerprints); updated in place
+        
+        Yields:
+            Review: Merged reviews ordered by scraped_at (newest first)
         """
-        # Create a set of existing review identifiers to avoid duplicates
-        existing_identifiers = set()
-        for review in existing_reviews:
-            # Use reviewer + review_text as identifier
-            identifier = f"{review.get('reviewer', '')}_{review.get('review_text', '')}"
-            existing_identifiers.add(identifier)
+        if dedup not in ('exact', 'near'):
+            raise ValueError(f"Unsupported dedup mode: {dedup}. Supported modes: ['exact', 'near']")
         
-        # Filter out new reviews that already exist
-        unique_new_reviews = []
-        for review in new_reviews:
-            identifier = f"{review.get('reviewer', '')}_{review.get('review_text', '')}"
-            if identifier not in existing_identifiers:
-                unique_new_reviews.append(review)
+        # Create a set of existing review fingerprints to avoid duplicates
+        if existing_identifiers is None:
+            existing_identifiers = self.get_review_fingerprints(existing_reviews)
         
-        # Combine all reviews
-        all_reviews = existing_reviews + unique_new_reviews
+        lsh = None
+        if dedup == 'near':
+            from datasketch import MinHashLSH
+            lsh = MinHashLSH(threshold=_NEAR_DUP_THRESHOLD, num_perm=_NEAR_DUP_NUM_PERM)
+            for i, review in enumerate(existing_reviews):
+                minhash = _review_minhash(review.review_text)
+                if minhash is not None:
+                    lsh.insert(f"existing_{i}", minhash)
         
-        Logger.info(f"Merged reviews: {len(existing_reviews)} existing + {len(unique_new_reviews)} new = {len(all_reviews)} total")
+        # Stream new reviews that do not exist yet
+        new_count = 0
+        near_duplicate_count = 0
+
+        def unique_new_reviews():
+            nonlocal new_count, near_duplicate_count
+            for i, review in enumerate(new_reviews):
+                identifier = _review_fingerprint(review.reviewer, review.review_text)
+                if identifier in existing_identifiers:
+                    continue
+                existing_identifiers.add(identifier)
+                
+                if lsh is not None:
+                    minhash = _review_minhash(review.review_text)
+                    if minhash is not None:
+                        if lsh.query(minhash):
+                            near_duplicate_count += 1
+                            continue
+                        lsh.insert(f"new_{i}", minhash)
+                
+                new_count += 1
+                yield review
         
-        # Sort by scraped_at timestamp (newest first)
-        try:
-            all_reviews.sort(key=lambda x: x.get('scraped_at', ''), reverse=True)
-        except Exception as e:
-            Logger.error(f"Warning: Could not sort reviews by timestamp: {e}")
+        # New reviews go first on equal timestamps
+        yield from heapq.merge(unique_new_reviews(), existing_reviews, key=_scraped_at_key, reverse=True)
         
-        return all_reviews
+        if lsh is not None:
+            Logger.info(f"Skipped {near_duplicate_count} near-duplicate reviews")
+        Logger.info(f"Merged reviews: {len(existing_reviews)} existing + {new_count} new = {len(existing_reviews) + new_count} total")
     
-    def get_reviews_data(self, app_id, sort_order=Sort.NEWEST, lang='en', country='us', max_reviews=None):
+    def _fetch_reviews_page(self, app_id, rate_limiter=None, **kwargs):
         """
-        Fetch all available reviews data from Google Play Store using the official library
+        Fetch one page of reviews, paced by the rate limiter and retried with exponential backoff
+        
+        google_play_scraper swallows HTTP errors (e.g. 429) inside a page fetch and returns
+        an empty page without continuation token, which is also how the reviews can end;
+        since the previous token is still valid, such a page is retried once before it is
+        taken as the end of the reviews.
+        
+        Returns:
+            tuple: (list of review dicts, continuation token)
+        """
+        delay = _BACKOFF_INITIAL_SECONDS
+        empty_retries = 0
+        for attempt in range(1, _FETCH_MAX_ATTEMPTS + 1):
+            if rate_limiter is not None:
+                rate_limiter.acquire()
+            
+            try:
+                page, continuation_token = reviews(app_id, **kwargs)
+            except Exception as e:
+                if attempt == _FETCH_MAX_ATTEMPTS:
+                    raise
+                Logger.info(f"Reviews page fetch failed ({e}), retrying in {delay:.0f}s "
+                            f"(attempt {attempt}/{_FETCH_MAX_ATTEMPTS})")
+            else:
+                maybe_throttled = (not page and continuation_token.token is None
+                                   and kwargs.get('continuation_token') is not None)
+                if not maybe_throttled or empty_retries >= _EMPTY_PAGE_RETRIES or attempt == _FETCH_MAX_ATTEMPTS:
+                    if maybe_throttled:
+                        Logger.debug("Empty reviews page without continuation token, taking it as the end of the reviews")
+                    return page, continuation_token
+                empty_retries += 1
+                Logger.debug("Empty reviews page without continuation token, retrying in %.0fs", delay)
+            
+            time.sleep(delay)
+            delay = min(delay * 2, _BACKOFF_MAX_SECONDS)
+
+    def get_reviews_data(self, app_id, sort_order=Sort.NEWEST, lang='en', country='us', max_reviews=None,
+                         known_fingerprints=None, early_stop_consecutive_hits=None, requests_per_second=1.0):
+        """
+        Fetch available reviews data from Google Play Store using the official library
+        
+        Reviews are fetched page by page. With newest-first sorting and the
+        fingerprints of the reviews already stored, fetching stops at the first
+        page made only of known reviews, so later scrapes only fetch new reviews.
 
         Args:
             app_id (str): The app ID (package name)
@@ -130,12 +378,16 @@ class GooglePlayScraper:
             lang (str): Language code for reviews (default 'en')
             country (str): Country code for reviews (default 'us')
             max_reviews (int or None): Maximum number of reviews to fetch (None for all)
+            known_fingerprints (set or None): Fingerprints of reviews already stored
+                         (see get_review_fingerprints); only used with Sort.NEWEST
+            early_stop_consecutive_hits (int or None): Also stop after this many
+                         consecutive known reviews (None to only stop on a fully known page)
+            requests_per_second (float or None): Maximum rate of review page requests
+                         (default 1.0, None for no limit)
 
-        Returns:
-            list: List of review dictionaries
+        Yields:
+            Review: Review rows in CSV column order
         """
-        reviews_data = []
-
         try:
             Logger.info(f"Fetching app information for: {app_id}")
             # Get app information first
@@ -144,59 +396,91 @@ class GooglePlayScraper:
             Logger.info(f"App name: {app_name}")
 
             Logger.info(f"Fetching reviews with settings - Sort: {sort_order}, Lang: {lang}, Country: {country}")
-            # Get all reviews using the official library (no count limit)
-            reviews_result = reviews_all(
+            page_size = _REVIEWS_PAGE_SIZE if max_reviews is None else min(_REVIEWS_PAGE_SIZE, max_reviews)
+            rate_limiter = _TokenBucket(requests_per_second) if requests_per_second else None
+            page, continuation_token = self._fetch_reviews_page(
                 app_id,
+                rate_limiter=rate_limiter,
                 lang=lang,
                 country=country,
-                sort=sort_order
+                sort=sort_order,
+                count=page_size
             )
 
-            Logger.info(f"Retrieved {len(reviews_result)} reviews from Google Play Store")
-
-            # Convert to our format
-            for review in reviews_result:
-                reviews_data.append({
-                    'app_id': app_id,
-                    'app_name': app_name,
-                    'reviewer': review.get('userName', 'Anonymous'),
-                    'rating': review.get('score', 'N/A'),
-                    'review_text': review.get('content', ''),
-                    'review_date': review.get('at', '').strftime('%Y-%m-%d %H:%M:%S') if review.get('at') else '',
-                    'thumbs_up': review.get('thumbsUpCount', 0),
-                    'reply_text': review.get('replyContent', ''),
-                    'scraped_at': datetime.now().isoformat()
-                })
-
-            if not reviews_data:
-                Logger.info(f"No reviews found for app: {app_id}")
-                reviews_data.append({
-                    'app_id': app_id,
-                    'app_name': app_name,
-                    'reviewer': 'No reviews found',
-                    'rating': 'N/A',
-                    'review_text': 'No reviews available for this app.',
-                    'review_date': '',
-                    'thumbs_up': 0,
-                    'reply_text': '',
-                    'scraped_at': datetime.now().isoformat()
-                })
-
         except Exception as e:
             Logger.error(f"Error fetching reviews for {app_id}: {e}")
-            reviews_data.append({
-                'app_id': app_id,
-                'app_name': 'Unknown',
-                'reviewer': 'Error',
-                'rating': 'N/A',
-                'review_text': f'Failed to fetch reviews: {e}',
-                'review_date': '',
-                'thumbs_up': 0,
-                'reply_text': '',
-                'scraped_at': datetime.now().isoformat()
-            })
-
-        return reviews_data
+            yield Review(
+                app_id=app_id,
+                app_name='Unknown',
+                reviewer='Error',
+                rating='N/A',
+                review_text=f'Failed to fetch reviews: {e}',
+                review_date='',
+                thumbs_up=0,
+                reply_text='',
+                scraped_at=datetime.now().isoformat()
+            )
+            return
+
+        # All reviews of one scrape share the same timestamp
+        scraped_at = datetime.now().isoformat()
+
+        # Known reviews are only contiguous in newest-first order
+        early_stop = known_fingerprints is not None and sort_order == Sort.NEWEST
+        fetched_count = 0
+        page_count = 1
+        consecutive_hits = 0
+
+        while page:
+            if max_reviews is not None:
+                page = page[:max_reviews - fetched_count]
+
+            page_hits = 0
+            for review in page:
+                row = _review_row(review, app_id, app_name, scraped_at)
+                fetched_count += 1
+
+                if early_stop:
+                    if _review_fingerprint(row.reviewer, row.review_text) in known_fingerprints:
+                        page_hits += 1
+                        consecutive_hits += 1
+                    else:
+                        consecutive_hits = 0
+
+                yield row
+
+                if early_stop_consecutive_hits and consecutive_hits >= early_stop_consecutive_hits:
+                    break
+
+            if early_stop and (page_hits == len(page) or
+                               early_stop_consecutive_hits and consecutive_hits >= early_stop_consecutive_hits):
+                Logger.info(f"Reached already stored reviews, stopping after {page_count} pages")
+                break
+            if continuation_token.token is None or (max_reviews is not None and fetched_count >= max_reviews):
+                break
+
+            page, continuation_token = self._fetch_reviews_page(
+                app_id,
+                rate_limiter=rate_limiter,
+                continuation_token=continuation_token
+            )
+            page_count += 1
+
+        Logger.info(f"Retrieved {fetched_count} reviews from Google Play Store")
+
+        if not fetched_count:
+            Logger.info(f"No reviews found for app: {app_id}")
+            yield Review(
+                app_id=app_id,
+                app_name=app_name,
+                reviewer='No reviews found',
+                rating='N/A',
+                review_text='No reviews available for this app.',
+                review_date='',
+                thumbs_up=0,
+                reply_text='',
+                scraped_at=scraped_at
+            )
 
     def get_app_details(self, app_id):
         """
@@ -209,15 +493,16 @@ class GooglePlayScraper:
             dict: App information dictionary
         """
         try:
-            Logger.debug(f"Fetching app details for: {app_id}")
+            Logger.debug("Fetching app details for: %s", app_id)
             app_info = app(app_id)
-            Logger.debug(f"Successfully retrieved app details for: {app_id}")
+            Logger.debug("Successfully retrieved app details for: %s", app_id)
             return app_info
         except Exception as e:
             Logger.error(f"Error getting app details for {app_id}: {e}")
             return None
     
-    def scrap(self, url, sort_order=Sort.NEWEST, lang='en', country='us', max_reviews=None):
+    def scrap(self, url, sort_order=Sort.NEWEST, lang='en', country='us', max_reviews=None, dedup='exact',
+              early_stop_consecutive_hits=None, requests_per_second=1.0):
         """
         Scrape all available feedback from Google Play Store app URL and save to CSV
 
@@ -227,6 +512,11 @@ class GooglePlayScraper:
             lang (str): Language code for reviews (default 'en')
             country (str): Country code for reviews (default 'us')
             max_reviews (int or None): Maximum number of reviews to fetch (None for all)
+            dedup (str): Duplicate detection mode, 'exact' (default) or 'near' (see merge_reviews)
+            early_stop_consecutive_hits (int or None): Stop fetching after this many consecutive
+                         already stored reviews (see get_reviews_data)
+            requests_per_second (float or None): Maximum rate of review page requests
+                         (default 1.0, None for no limit)
 
         Returns:
             str: Path to the generated CSV file
@@ -236,32 +526,51 @@ class GooglePlayScraper:
             # Extract app ID from URL
             app_id = self.extract_app_id(url)
 
+            # Skip apps scraped recently
+            if self.ttl_seconds:
+                cached_path = self.get_cached_csv(app_id)
+                if cached_path:
+                    Logger.info(f"Reviews file is within the TTL ({self.ttl_seconds}s), skipping scrape: {cached_path}")
+                    return cached_path
+
             # Get existing reviews if any
             existing_reviews, csv_path = self.get_existing_reviews(app_id)
+            existing_identifiers = self.get_review_fingerprints(existing_reviews)
 
-            # Get reviews data with language, country, and max_reviews settings
+            # Stream reviews data with language, country, and max_reviews settings
             new_reviews = self.get_reviews_data(
                 app_id,
                 sort_order=sort_order,
                 lang=lang,
                 country=country,
-                max_reviews=max_reviews
+                max_reviews=max_reviews,
+                known_fingerprints=existing_identifiers if existing_reviews else None,
+                early_stop_consecutive_hits=early_stop_consecutive_hits,
+                requests_per_second=requests_per_second
             )
 
-            # Merge with existing reviews (newest first, no duplicates)
-            all_reviews = self.merge_reviews(existing_reviews, new_reviews)
+            # Merge with existing reviews (newest first, no duplicates) while writing,
+            # into a temporary file so an interrupted scrape keeps the previous CSV
+            tmp_path = f"{csv_path}.tmp"
+            review_count = 0
 
-            # Write to CSV
-            if all_reviews:
-                fieldnames = ['app_id', 'app_name', 'reviewer', 'rating', 'review_text',
-                              'review_date', 'thumbs_up', 'reply_text', 'scraped_at']
-
-                with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(all_reviews)
+            try:
+                with open(tmp_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+                    writer = csv.writer(csvfile)
+                    writer.writerow(REVIEW_FIELDS)
+                    for review in self.merge_reviews(existing_reviews, new_reviews, dedup=dedup,
+                                                     existing_identifiers=existing_identifiers):
+                        writer.writerow(review)
+                        review_count += 1
+                is_new_file = not os.path.exists(csv_path)
+                os.replace(tmp_path, csv_path)
+                if is_new_file and self._count_cache is not None:
+                    self._count_cache += 1
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
 
-                Logger.info(f"Successfully saved {len(all_reviews)} reviews to: {csv_path}")
+            Logger.info(f"Successfully saved {review_count} reviews to: {csv_path}")
 
             return csv_path
 
@@ -270,8 +579,14 @@ class GooglePlayScraper:
             raise e
     
     def get_review_count(self):
-        """Get the number of CSV files in the output directory"""
-        csv_files = [f for f in os.listdir(self.output_dir) if f.endswith('.csv')]
-        count = len(csv_files)
-        Logger.debug(f"Found {count} CSV files in output directory")
-        return count
+        """
+        Get the number of CSV files in the output directory
+        
+        The directory is scanned once; files created by scrap are counted as they
+        are written, files added or removed by other means are not.
+        """
+        if self._count_cache is None:
+            with os.scandir(self.output_dir) as entries:
+                self._count_cache = sum(1 for entry in entries if entry.name.endswith('.csv'))
+            Logger.debug("Found %d CSV files in output directory", self._count_cache)
+        return self._count_cache
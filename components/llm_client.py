@@ -1,6 +1,55 @@
-from openai import OpenAI
+import asyncio
+import os
+import threading
+import httpx
+from dataclasses import dataclass
+from typing import Optional
+from openai import AsyncOpenAI, OpenAI
 from .logger import Logger
 
+# Longest backoff of the OpenAI SDK between two retries, in seconds
+_SDK_MAX_RETRY_DELAY = 8.0
+
+
+@dataclass(frozen=True)
+class TimeoutConfig:
+    """
+    Limits applied to every LLM invocation, so a stalled request cannot block an evaluation.
+    
+    Attributes:
+        timeout: Seconds to wait for one request attempt
+        max_retries: Number of times the SDK retries a failed or timed out request
+        max_output_tokens: Maximum number of tokens generated per response (None for no limit);
+                           with reasoning models the reasoning tokens count against it too,
+                           so a low cap can truncate or empty the response
+        deadline: Seconds to wait for an async invocation, retries included
+                  (None to derive it from timeout and max_retries)
+    """
+    timeout: float = 120.0
+    max_retries: int = 3
+    max_output_tokens: Optional[int] = None
+    deadline: Optional[float] = None
+
+    @classmethod
+    def from_env(cls) -> "TimeoutConfig":
+        """
+        Create the configuration from the LLM_TIMEOUT, LLM_MAX_RETRIES and
+        LLM_MAX_OUTPUT_TOKENS environment variables, using the defaults for unset ones.
+        """
+        max_output_tokens = os.getenv("LLM_MAX_OUTPUT_TOKENS")
+        return cls(
+            timeout = float(os.getenv("LLM_TIMEOUT", cls.timeout)),
+            max_retries = int(os.getenv("LLM_MAX_RETRIES", cls.max_retries)),
+            max_output_tokens = int(max_output_tokens) if max_output_tokens else cls.max_output_tokens,
+        )
+
+    def get_deadline(self) -> float:
+        """Seconds to wait for an invocation, retries and the SDK backoff between them included."""
+        if self.deadline is not None:
+            return self.deadline
+        return self.timeout * (self.max_retries + 1) + _SDK_MAX_RETRY_DELAY * self.max_retries
+
+
 class LLMClient:
     """
     Large Language Model Client for AI-powered evaluations.
@@ -25,22 +74,121 @@ class LLMClient:
     - Processes evaluation prompts and generates insights
     - Handles complex reasoning tasks for usability analysis
     """
-    def __init__(self, base_url: str, api_key: str, model_name: str, temperature=1.0, stream=False):
+    # Image input capability probed by ActivePersona: OpenAI-compatible chat
+    # completions accept remote image URLs
+    supports_url_images = True
+
+    # HTTP clients shared by all LLMClients, so that connections to a provider are
+    # pooled and kept alive across models; the async one is bound to its event loop
+    _http = None
+    _async_http = None
+    _async_http_loop = None
+    _http_lock = threading.Lock()
+    # Pending closes of async HTTP clients replaced by a new event loop's client
+    _closing_tasks = set()
+
+    @staticmethod
+    def _http_client_options() -> dict:
+        """
+        Options of the shared HTTP clients; HTTP/2 is used when the h2 package is installed.
+        """
+        try:
+            import h2  # noqa: F401
+            http2 = True
+        except ImportError:
+            http2 = False
+        return {
+            "http2": http2,
+            "limits": httpx.Limits(max_connections=100, max_keepalive_connections=32),
+            "timeout": httpx.Timeout(600.0, connect=5.0),
+            "follow_redirects": True,
+        }
+
+    @classmethod
+    def _get_http_client(cls) -> httpx.Client:
+        """Get the shared HTTP client, creating it on first use."""
+        with cls._http_lock:
+            if cls._http is None:
+                cls._http = httpx.Client(**cls._http_client_options())
+        return cls._http
+
+    @classmethod
+    def _get_async_http_client(cls) -> httpx.AsyncClient:
+        """
+        Get the shared async HTTP client of the running event loop, creating it on first use.
+        
+        The client of a previous event loop is closed when it is replaced; call
+        aclose_async_clients before leaving an event loop to close it deterministically.
+        """
+        loop = asyncio.get_running_loop()
+        if cls._async_http is None or cls._async_http_loop is not loop:
+            if cls._async_http is not None:
+                cls._close_stale_async_http(cls._async_http, cls._async_http_loop)
+            cls._async_http = httpx.AsyncClient(**cls._http_client_options())
+            cls._async_http_loop = loop
+        return cls._async_http
+
+    @classmethod
+    def _close_stale_async_http(cls, client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop):
+        """
+        Close the async HTTP client of another event loop, on that loop if it still runs.
+        """
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            return
+        
+        def closed(task: asyncio.Task):
+            cls._closing_tasks.discard(task)
+            if not task.cancelled() and task.exception() is not None:
+                Logger.debug("Closing stale async HTTP client failed: %s", task.exception())
+        
+        task = asyncio.get_running_loop().create_task(client.aclose())
+        cls._closing_tasks.add(task)
+        task.add_done_callback(closed)
+
+    @classmethod
+    async def aclose_async_clients(cls):
+        """
+        Close the shared async HTTP client of the running event loop, if any.
+        
+        Call it before the event loop ends (e.g. at the end of the coroutine passed
+        to asyncio.run) so its connections are released; a new client is created
+        if LLMClients are invoked asynchronously again.
+        """
+        if cls._async_http is None or cls._async_http_loop is not asyncio.get_running_loop():
+            return
+        client = cls._async_http
+        cls._async_http = None
+        cls._async_http_loop = None
+        await client.aclose()
+        Logger.debug("Closed the shared async HTTP client")
+
+    def __init__(self, base_url: str, api_key: str, model_name: str, temperature=1.0, stream=False,
+                 timeout_config: TimeoutConfig = None):
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
         self.model_name = model_name
         self.temperature = temperature
         self.stream = stream
+        self.timeout_config = timeout_config if timeout_config is not None else TimeoutConfig()
         
         Logger.debug(f"Initializing LLMClient with model: {model_name}")
         Logger.debug(f"Base URL: {base_url}")
         Logger.debug(f"Temperature: {temperature}, Stream: {stream}")
+        Logger.debug(f"Limits: {self.timeout_config}")
         
         try:
             self.client = OpenAI(
                 base_url = self.base_url,
                 api_key = self.api_key,
+                http_client = self._get_http_client(),
+                timeout = self.timeout_config.timeout,
+                max_retries = self.timeout_config.max_retries,
             )
+            # The async client is bound to the event loop it is used in, so it is
+            # created lazily (see _get_async_client)
+            self._async_client = None
+            self._async_client_http = None
             Logger.info(f"LLMClient successfully initialized for model: {model_name}")
         except Exception as e:
             Logger.error(f"Failed to initialize LLMClient for model {model_name}: {str(e)}")
@@ -49,6 +197,22 @@ class LLMClient:
     def get_model_name(self):
         return self.model_name
 
+    def supports_prompt_caching(self):
+        """
+        Whether the provider needs explicit `cache_control` breakpoints to cache prompts.
+        
+        Anthropic models only cache marked prefixes; OpenAI-style providers cache
+        repeated prefixes automatically.
+        """
+        model_name = self.model_name.lower()
+        return model_name.startswith('anthropic/') or 'claude' in model_name
+
+    def _completion_limits(self) -> dict:
+        """Extra completion parameters limiting the response size."""
+        if self.timeout_config.max_output_tokens is None:
+            return {}
+        return {"max_tokens": self.timeout_config.max_output_tokens}
+
     def invoke(self, messages):
         """
         Invoke the LLM with the provided messages.
@@ -59,7 +223,7 @@ class LLMClient:
         Returns:
             str: Response content from the LLM
         """
-        Logger.debug(f"Invoking LLM {self.model_name} with {len(messages)} messages")
+        Logger.debug("Invoking LLM %s with %d messages", self.model_name, len(messages))
         
         try:
             extra_headers = {
@@ -72,13 +236,14 @@ class LLMClient:
                 model = self.model_name,
                 stream = self.stream,
                 temperature = self.temperature,
-                messages = messages
+                messages = messages,
+                **self._completion_limits()
             )
 
             content = completion.choices[0].message.content
             
-            Logger.debug(f"LLM {self.model_name} response received successfully")
-            Logger.debug(f"Response length: {len(content)} characters")
+            Logger.debug("LLM %s response received successfully", self.model_name)
+            Logger.debug("Response length: %d characters", len(content))
             
             return content
             
@@ -86,3 +251,65 @@ class LLMClient:
             Logger.error(f"LLM {self.model_name} invocation failed: {str(e)}")
             Logger.error(f"Request details - Temperature: {self.temperature}, Stream: {self.stream}")
             raise
+
+    def _get_async_client(self) -> AsyncOpenAI:
+        """
+        Get the async client for the running event loop, creating it on first use.
+        
+        Connections of an async client cannot be reused across event loops, so a
+        new client is created whenever the shared async HTTP client changes (see
+        _get_async_http_client). It holds no connections of its own and is never
+        closed itself, since closing it would close the shared HTTP client.
+        """
+        http_client = self._get_async_http_client()
+        if self._async_client is None or self._async_client_http is not http_client:
+            self._async_client = AsyncOpenAI(
+                base_url = self.base_url,
+                api_key = self.api_key,
+                http_client = http_client,
+                timeout = self.timeout_config.timeout,
+                max_retries = self.timeout_config.max_retries,
+            )
+            self._async_client_http = http_client
+        return self._async_client
+
+    async def ainvoke(self, messages):
+        """
+        Invoke the LLM asynchronously with the provided messages.
+        
+        Args:
+            messages: List of message dictionaries containing conversation history
+            
+        Returns:
+            str: Response content from the LLM
+        """
+        Logger.debug("Invoking LLM %s asynchronously with %d messages", self.model_name, len(messages))
+        
+        try:
+            extra_headers = {
+                "HTTP-Referer": "<YOUR_SITE_URL>",
+                "X-Title": "<YOUR_SITE_NAME>",
+            }
+
+            completion = await asyncio.wait_for(
+                self._get_async_client().chat.completions.create(
+                    extra_headers = extra_headers,
+                    model = self.model_name,
+                    temperature = self.temperature,
+                    messages = messages,
+                    **self._completion_limits()
+                ),
+                timeout = self.timeout_config.get_deadline()
+            )
+
+            content = completion.choices[0].message.content
+            
+            Logger.debug("LLM %s response received successfully", self.model_name)
+            Logger.debug("Response length: %d characters", len(content))
+            
+            return content
+            
+        except Exception as e:
+            Logger.error(f"LLM {self.model_name} async invocation failed: {str(e)}")
+            Logger.error(f"Request details - Temperature: {self.temperature}")
+            raise
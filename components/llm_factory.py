@@ -1,5 +1,6 @@
+import asyncio
 import os
-from .llm_client import LLMClient
+from .llm_client import LLMClient, TimeoutConfig
 from .logger import Logger
 
 class LLMClientFactory:
@@ -83,7 +84,8 @@ class LLMClientFactory:
             'api_key': os.getenv("OPENAI_API_KEY"),
             'model_name': os.getenv(config['env_key'], config['default_value']),
             'temperature': float(os.getenv("MODEL_TEMPERATURE", "1.0")),
-            'stream': os.getenv("MODEL_STREAM", "False").lower() == "true"
+            'stream': os.getenv("MODEL_STREAM", "False").lower() == "true",
+            'timeout_config': TimeoutConfig.from_env()
         }
         
         # Override with any provided kwargs
@@ -100,12 +102,14 @@ class LLMClientFactory:
             raise
     
     @classmethod
-    def create_clients(cls, model_types: list) -> dict:
+    def create_clients(cls, model_types: list, timeout_config: TimeoutConfig = None) -> dict:
         """
         Create multiple LLMClient instances.
         
         Args:
             model_types (list): List of model types to create
+            timeout_config (TimeoutConfig): Invocation limits of all clients
+                                            (default: from environment variables)
             
         Returns:
             dict: Dictionary mapping model_type to LLMClient instance
@@ -113,9 +117,10 @@ class LLMClientFactory:
         Logger.info(f"Creating LLM clients for models: {model_types}")
         clients = {}
         
+        overrides = {} if timeout_config is None else {'timeout_config': timeout_config}
         for model_type in model_types:
             try:
-                clients[model_type] = cls.create_client(model_type)
+                clients[model_type] = cls.create_client(model_type, **overrides)
                 Logger.debug(f"Successfully added client for {model_type}")
             except Exception as e:
                 Logger.error(f"Failed to create client for {model_type}: {str(e)}")
@@ -125,6 +130,39 @@ class LLMClientFactory:
         Logger.info(f"Successfully created {len(clients)} LLM clients out of {len(model_types)} requested")
         return clients
     
+    @classmethod
+    async def acreate_clients(cls, model_types: list, timeout_config: TimeoutConfig = None) -> dict:
+        """
+        Create multiple LLMClient instances concurrently, for async callers.
+        
+        Args:
+            model_types (list): List of model types to create
+            timeout_config (TimeoutConfig): Invocation limits of all clients
+                                            (default: from environment variables)
+            
+        Returns:
+            dict: Dictionary mapping model_type to LLMClient instance, in the requested order
+        """
+        Logger.info(f"Creating LLM clients for models: {model_types}")
+        
+        overrides = {} if timeout_config is None else {'timeout_config': timeout_config}
+        results = await asyncio.gather(
+            *(asyncio.to_thread(cls.create_client, model_type, **overrides) for model_type in model_types),
+            return_exceptions=True
+        )
+        
+        clients = {}
+        for model_type, result in zip(model_types, results):
+            if isinstance(result, Exception):
+                Logger.error(f"Failed to create client for {model_type}: {str(result)}")
+                # Continue with other models even if one fails
+                continue
+            clients[model_type] = result
+            Logger.debug(f"Successfully added client for {model_type}")
+        
+        Logger.info(f"Successfully created {len(clients)} LLM clients out of {len(model_types)} requested")
+        return clients
+    
     @classmethod
     def get_available_models(cls) -> list:
         """Get list of available model types."""
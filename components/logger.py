@@ -1,8 +1,13 @@
+import atexit
+import functools
 import logging
+import queue
 import sys
 import os
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 class Logger:
     """
@@ -15,62 +20,57 @@ class Logger:
     Usage:
         Logger.info("Application started")
         Logger.error("Failed to process request") 
-        Logger.debug("Processing user input")
+        Logger.debug("Processing user input: %s", user_input)
+    
+    Extra positional arguments are merged into the message with %-formatting
+    only when the message is actually logged, so prefer them over f-strings
+    in frequently executed code.
     
     Environment Variables:
         LOG_FILE: Path to log file (default: ./logs/app.log)
         LOG_LEVEL: Minimum log level (default: INFO)
     
+    Log records are handed to a queue and written to the log file by a
+    background thread, so logging calls never block on disk I/O. Pending
+    records are written at interpreter exit.
+    
     Format: YYYY-MM-DD HH:MM:SS - logger_name - LEVEL - message
     """
     
-    _loggers = {}
     _formatter = None
-    _log_level = None
+    _queue_handler = None
+    _listener = None
+    _lock = threading.Lock()
     
     @staticmethod
-    def _get_log_level():
-        """Get the minimum log level from environment variable."""
-        if Logger._log_level is None:
-            Logger._log_level = os.getenv("LOG_LEVEL", "INFO").upper()
-        return Logger._log_level
+    @functools.lru_cache(maxsize=None)
+    def _get_settings() -> Tuple[int, str]:
+        """
+        Get the numeric minimum log level and the log file path from environment variables.
+        
+        They are read once, on first use rather than at import time, since entry
+        scripts load their .env file after importing the components.
+        """
+        level = os.getenv("LOG_LEVEL", "INFO").upper()
+        log_file = os.getenv("LOG_FILE", "./logs/app.log")
+        return getattr(logging, level), log_file
     
     @staticmethod
-    def get_logger(name: str = __name__, level: str = None) -> logging.Logger:
+    def _get_queue_handler() -> QueueHandler:
         """
-        Get or create a logger instance for the specified name.
-        
-        Args:
-            name: Logger identifier (typically __name__)
-            level: Logging level override (uses LOG_LEVEL env var if None)
-        
-        Returns:
-            Configured logger instance with file handler
+        Get the handler shared by all loggers, starting the file writer thread on first use.
+        Must be called with Logger._lock held.
         """
-        # Return existing logger if already created
-        if name in Logger._loggers:
-            return Logger._loggers[name]
-        
-        # Use environment log level if not specified
-        if level is None:
-            level = Logger._get_log_level()
-        
-        # Create logger
-        logger = logging.getLogger(name)
-        logger.setLevel(getattr(logging, level.upper()))
-        
-        # Avoid adding multiple handlers if logger already configured
-        if not logger.handlers:
-            # Get log file path from environment variable
-            log_file = os.getenv("LOG_FILE", "./logs/app.log")
+        if Logger._queue_handler is None:
+            log_file = Logger._get_settings()[1]
             
             # Create log directory if it doesn't exist
             log_path = Path(log_file)
             log_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Create file handler with environment log level
+            # Single file handler, written by the listener thread; levels are
+            # filtered by each logger before records are queued
             file_handler = logging.FileHandler(log_file, encoding='utf-8')
-            file_handler.setLevel(getattr(logging, level.upper()))
             
             # Create formatter if not exists
             if Logger._formatter is None:
@@ -81,24 +81,70 @@ class Logger:
             
             file_handler.setFormatter(Logger._formatter)
             
-            # Add handler to logger
-            logger.addHandler(file_handler)
+            log_queue = queue.SimpleQueue()
+            Logger._listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+            Logger._listener.start()
+            # Flush queued records before the interpreter exits
+            atexit.register(Logger._listener.stop)
+            
+            Logger._queue_handler = QueueHandler(log_queue)
+        
+        return Logger._queue_handler
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_logger(name: str = __name__, level: str = None) -> logging.Logger:
+        """
+        Get or create a logger instance for the specified name.
+        
+        Loggers are memoized, so repeated calls are a single cache lookup.
+        
+        Args:
+            name: Logger identifier (typically __name__)
+            level: Logging level override (uses LOG_LEVEL env var if None)
+        
+        Returns:
+            Configured logger instance with the shared queue handler
+        """
+        # Use environment log level if not specified
+        if level is None:
+            level_no = Logger._get_settings()[0]
+        else:
+            level_no = getattr(logging, level.upper())
+        
+        # Create logger
+        logger = logging.getLogger(name)
+        logger.setLevel(level_no)
+        
+        # Avoid adding multiple handlers if logger already configured
+        with Logger._lock:
+            if not logger.handlers:
+                logger.addHandler(Logger._get_queue_handler())
         
-        # Cache the logger
-        Logger._loggers[name] = logger
         return logger
     
     @staticmethod
-    def info(message: str, name: str = __name__):
+    def is_enabled_for(level: int, name: str = __name__) -> bool:
+        """Check whether a message of the given level would be logged, to skip building expensive arguments."""
+        return Logger.get_logger(name).isEnabledFor(level)
+    
+    @staticmethod
+    def info(message: str, *args, name: str = __name__):
         """Log an informational message for general status and progress updates."""
-        Logger.get_logger(name).info(message)
+        logger = Logger.get_logger(name)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(message, *args)
     
     @staticmethod
-    def debug(message: str, name: str = __name__):
+    def debug(message: str, *args, name: str = __name__):
         """Log a debug message for detailed troubleshooting information."""
-        Logger.get_logger(name).debug(message)
+        logger = Logger.get_logger(name)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(message, *args)
     
     @staticmethod
-    def error(message: str, name: str = __name__):
+    def error(message: str, *args, name: str = __name__):
         """Log an error message for failures and exceptions."""
-        Logger.get_logger(name).error(message)
+        logger = Logger.get_logger(name)
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(message, *args)
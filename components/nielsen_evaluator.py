@@ -1,6 +1,7 @@
 import logging
+import os
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional
 from .active_persona import ActivePersona
 from .evaluator import EvaluatorBase
 from .logger import Logger
@@ -27,41 +28,128 @@ class NielsenEvaluator(EvaluatorBase):
     - Integration with persona-driven evaluation workflows
     """
     
-    def __init__(self, evaluation_prompt: str, auto_reset: bool = True):
-        Logger.debug(f"Initializing NielsenEvaluator with auto_reset={auto_reset}")
+    def __init__(self, evaluation_prompt: str, auto_reset: bool = True, provider_concurrency: int = None):
+        """
+        Args:
+            evaluation_prompt (str): The Nielsen evaluation questionnaire
+            auto_reset (bool): Reset the persona's history before each iteration (default: True)
+            provider_concurrency (int): Maximum number of requests in flight per provider
+                                        (default: MAX_CONCURRENCY environment variable, or 4)
+        """
+        if provider_concurrency is None:
+            provider_concurrency = self._default_concurrency()
+        
+        Logger.debug(f"Initializing NielsenEvaluator with auto_reset={auto_reset}, provider_concurrency={provider_concurrency}")
         Logger.debug(f"Evaluation prompt length: {len(evaluation_prompt)} characters")
         
         super().__init__(
             evaluation_prompt = evaluation_prompt,
-            auto_reset = auto_reset
+            auto_reset = auto_reset,
+            provider_concurrency = provider_concurrency
         )
         
         Logger.debug("NielsenEvaluator initialization completed successfully")
     
-    def evaluate_and_save(self, active_persona: ActivePersona, iterations: int = 1, save_in: str = None) -> Dict[str, Any]:
+    def evaluate_and_save(
+            self, 
+            active_persona: ActivePersona, 
+            iterations: int = 1, 
+            save_in: str = None, 
+            return_results: bool = True,
+            concurrency: int = None,
+            on_iter_done: Optional[Callable[[int, float], None]] = None
+        ) -> Optional[List[Dict[str, Any]]]:
         """
-        Save evaluation results to a JSON file.
+        Save evaluation results to a CSV file.
+        
+        Multiple iterations are run concurrently in worker threads (see
+        EvaluatorBase.evaluate), at most `concurrency` requests at a time.
         
         Args:
             active_persona (ActivePersona): The persona to conduct the evaluation
             iterations (int): Number of evaluation iterations to run (default: 1)
             save_in (str): Path where to save the results
+            return_results (bool): Whether to also return the evaluation entries (default: True)
+            concurrency (int): Maximum number of iterations run in parallel
+                               (default: MAX_CONCURRENCY environment variable, or 4)
+            on_iter_done (callable): Called with the iteration number and its duration in ms
+                                     after each iteration (default: None)
         """
-        Logger.debug(f"NielsenEvaluator starting evaluation for persona '{active_persona.name}'")
-        Logger.debug(f"Parameters: iterations={iterations}, save_in={save_in}")
+        if concurrency is None:
+            concurrency = self._default_concurrency()
+        
+        Logger.debug("NielsenEvaluator starting evaluation for persona '%s'", active_persona.name)
+        Logger.debug("Parameters: iterations=%s, save_in=%s, return_results=%s, concurrency=%s",
+                     iterations, save_in, return_results, concurrency)
         
         try:
             result = super().evaluate_and_save(
                 active_persona = active_persona, 
                 iterations = iterations, 
-                save_in = save_in
+                save_in = save_in,
+                return_results = return_results,
+                concurrency = concurrency,
+                on_iter_done = on_iter_done
+            )
+            
+            Logger.debug("NielsenEvaluator evaluation completed successfully for persona '%s'", active_persona.name)
+            if Logger.is_enabled_for(logging.DEBUG):
+                Logger.debug("Result keys: %s", list(result.keys()) if isinstance(result, dict) else 'Non-dict result')
+            
+            return result
+            
+        except Exception as e:
+            Logger.error(f"NielsenEvaluator evaluation failed for persona '{active_persona.name}': {str(e)}")
+            raise
+
+    async def evaluate_and_save_async(
+            self, 
+            active_persona: ActivePersona, 
+            iterations: int = 1, 
+            save_in: str = None, 
+            return_results: bool = True,
+            concurrency: int = None,
+            on_iter_done: Optional[Callable[[int, float], None]] = None
+        ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Save evaluation results to a CSV file, running the iterations concurrently with asyncio.
+        
+        Args:
+            active_persona (ActivePersona): The persona to conduct the evaluation
+            iterations (int): Number of evaluation iterations to run (default: 1)
+            save_in (str): Path where to save the results
+            return_results (bool): Whether to also return the evaluation entries (default: True)
+            concurrency (int): Maximum number of iterations run in parallel
+                               (default: MAX_CONCURRENCY environment variable, or 4)
+            on_iter_done (callable): Called with the iteration number and its duration in ms
+                                     after each iteration (default: None)
+        """
+        if concurrency is None:
+            concurrency = self._default_concurrency()
+        
+        Logger.debug("NielsenEvaluator starting async evaluation for persona '%s'", active_persona.name)
+        Logger.debug("Parameters: iterations=%s, save_in=%s, return_results=%s, concurrency=%s",
+                     iterations, save_in, return_results, concurrency)
+        
+        try:
+            result = await super().evaluate_and_save_async(
+                active_persona = active_persona, 
+                iterations = iterations, 
+                save_in = save_in,
+                return_results = return_results,
+                concurrency = concurrency,
+                on_iter_done = on_iter_done
             )
             
-            Logger.debug(f"NielsenEvaluator evaluation completed successfully for persona '{active_persona.name}'")
-            Logger.debug(f"Result keys: {list(result.keys()) if isinstance(result, dict) else 'Non-dict result'}")
+            Logger.debug("NielsenEvaluator evaluation completed successfully for persona '%s'", active_persona.name)
             
             return result
             
         except Exception as e:
             Logger.error(f"NielsenEvaluator evaluation failed for persona '{active_persona.name}': {str(e)}")
             raise
+
+    @staticmethod
+    def _default_concurrency() -> int:
+        """Maximum number of concurrent iterations, from the MAX_CONCURRENCY environment variable."""
+        return int(os.getenv("MAX_CONCURRENCY", "4"))
@@ -1,11 +1,14 @@
-import whisper
+import threading
+import ctranslate2
+from faster_whisper import WhisperModel
 
 class WhisperTranscriber:
     """
     Audio transcription service for voice-based UX evaluations.
     
     This class provides speech-to-text capabilities using OpenAI's Whisper model,
-    enabling personas to process and respond to audio-based evaluation materials.
+    run with faster-whisper (CTranslate2) and int8 quantized weights, enabling
+    personas to process and respond to audio-based evaluation materials.
     
     Key Responsibilities:
     - Transcribe audio files to text for persona processing
@@ -26,9 +29,34 @@ class WhisperTranscriber:
     - Enable multilingual evaluation scenarios
     """
     _default_instance = None
+    # Loaded models shared by all instances, keyed by (model_name, device, compute_type)
+    _model_cache = {}
+    _model_cache_lock = threading.Lock()
 
-    def __init__(self, model_name='small'):
-        self.model = whisper.load_model(model_name)
+    def __init__(self, model_name='small', device=None, fp16=None):
+        """
+        Args:
+            model_name (str): Whisper model size (default 'small')
+            device (str or None): 'cuda' or 'cpu' (default: cuda if available)
+            fp16 (bool or None): Compute non-quantized layers in half precision on cuda
+                                 (default: True on cuda)
+        """
+        if device is None:
+            device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        self.device = device
+        self.fp16 = device.startswith("cuda") if fp16 is None else fp16
+
+        # int8 weights; activations in float16 where supported
+        if device.startswith("cuda"):
+            compute_type = "int8_float16" if self.fp16 else "int8_float32"
+        else:
+            compute_type = "int8"
+
+        key = (model_name, device, compute_type)
+        with WhisperTranscriber._model_cache_lock:
+            if key not in WhisperTranscriber._model_cache:
+                WhisperTranscriber._model_cache[key] = WhisperModel(model_name, device=device, compute_type=compute_type)
+        self.model = WhisperTranscriber._model_cache[key]
 
     @staticmethod
     def defaultTranscriber():
@@ -38,5 +66,6 @@ class WhisperTranscriber:
         return WhisperTranscriber._default_instance
 
     def transcribe(self, audio_path):
-        result = self.model.transcribe(audio_path)
-        return result['text']
+        # Segments are decoded lazily while iterating
+        segments, _ = self.model.transcribe(audio_path)
+        return "".join(segment.text for segment in segments)
@@ -1,8 +1,86 @@
+import asyncio
+import csv
 import os
+from concurrent.futures import ThreadPoolExecutor
 from components.google_play_scraper import GooglePlayScraper
 from google_play_scraper import Sort
 
-def main():
+# Maximum number of apps scraped at the same time
+MAX_PARALLEL = 3
+
+def _count_rows(path):
+    """
+    Count the data rows of a CSV file (lines minus the header), reading it in binary chunks.
+
+    Physical lines are counted, not CSV records: a review whose text contains
+    line breaks is counted once per line.
+    """
+    with open(path, 'rb') as f:
+        line_count = sum(chunk.count(b'\n') for chunk in iter(lambda: f.read(1 << 20), b''))
+    return max(line_count - 1, 0)  # Subtract header
+
+def process_app(scraper, i, url, max_reviews):
+    """Scrape the reviews of one app and return the report lines to print."""
+    output = [f"{i}. Processing: {url}"]
+    try:
+        # Extract app ID to get app details first
+        app_id = scraper.extract_app_id(url)
+        
+        # Get and display app details
+        app_details = scraper.get_app_details(app_id)
+        
+        if app_details:
+            output.append(f"   App: {app_details.get('title', 'Unknown')} by {app_details.get('developer', 'Unknown')}")
+            output.append(f"   Rating: {app_details.get('score', 'N/A')}/5 | Installs: {app_details.get('installs', 'Unknown')}")
+        
+        lang = 'se'  # Language for reviews
+        country = 'se'  # Country for reviews
+
+        # Scrape reviews
+        csv_path = scraper.scrap(
+            url, 
+            max_reviews=max_reviews,
+            lang=lang,
+            country=country
+        )
+        
+        # Check file stats
+        if os.path.exists(csv_path):
+            # Count like the summary below, and only parse the latest review
+            line_count = _count_rows(csv_path)
+            with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+                sample_review = next(csv.DictReader(f), None)
+
+            output.append(f"   ✓ {line_count} reviews saved to: {csv_path}")
+            
+            # Show latest review
+            if sample_review:
+                reviewer = sample_review.get('reviewer', 'Unknown')
+                rating = sample_review.get('rating', 'N/A')
+                review_text = sample_review.get('review_text', '')
+                preview_text = review_text[:60] + "..." if len(review_text) > 60 else review_text
+                output.append(f"   Latest: {reviewer} ({rating}/5) - {preview_text}")
+        
+    except Exception as e:
+        output.append(f"   ✗ Error: {e}")
+    
+    return output
+
+async def scrape_apps(scraper, app_urls, max_reviews):
+    """Scrape all apps concurrently, at most MAX_PARALLEL at a time, and print their reports in order."""
+    semaphore = asyncio.Semaphore(MAX_PARALLEL)
+
+    async def run(i, url):
+        async with semaphore:
+            # The scraper is blocking, so each app runs in a worker thread
+            return await asyncio.to_thread(process_app, scraper, i, url, max_reviews)
+
+    reports = await asyncio.gather(*(run(i, url) for i, url in enumerate(app_urls, 1)))
+    for report in reports:
+        print("\n".join(report))
+        print()  # Add spacing between apps
+
+async def main():
     # Initialize the scraper
     scraper = GooglePlayScraper()
     
@@ -16,54 +94,7 @@ def main():
 
     print("=== Google Play Store Scraper ===\n")
     
-    for i, url in enumerate(app_urls, 1):
-        print(f"{i}. Processing: {url}")
-        try:
-            # Extract app ID to get app details first
-            app_id = scraper.extract_app_id(url)
-            
-            # Get and display app details
-            app_details = scraper.get_app_details(app_id)
-            
-            if app_details:
-                print(f"   App: {app_details.get('title', 'Unknown')} by {app_details.get('developer', 'Unknown')}")
-                print(f"   Rating: {app_details.get('score', 'N/A')}/5 | Installs: {app_details.get('installs', 'Unknown')}")
-            
-            lang = 'se'  # Language for reviews
-            country = 'se'  # Country for reviews
-
-            # Scrape reviews
-            csv_path = scraper.scrap(
-                url, 
-                max_reviews=max_reviews,
-                lang=lang,
-                country=country
-            )
-            
-            # Check file stats
-            if os.path.exists(csv_path):
-                with open(csv_path, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    line_count = len(lines) - 1  # Subtract header
-
-                print(f"   ✓ {line_count} reviews saved to: {csv_path}")
-                
-                # Show latest review
-                if len(lines) > 1:
-                    import csv
-                    with open(csv_path, 'r', encoding='utf-8') as f:
-                        reader = csv.DictReader(f)
-                        sample_review = next(reader)
-                        reviewer = sample_review.get('reviewer', 'Unknown')
-                        rating = sample_review.get('rating', 'N/A')
-                        review_text = sample_review.get('review_text', '')
-                        preview_text = review_text[:60] + "..." if len(review_text) > 60 else review_text
-                        print(f"   Latest: {reviewer} ({rating}/5) - {preview_text}")
-            
-        except Exception as e:
-            print(f"   ✗ Error: {e}")
-        
-        print()  # Add spacing between apps
+    await scrape_apps(scraper, app_urls, max_reviews)
     
     # Show summary
     total_files = scraper.get_review_count()
@@ -71,26 +102,38 @@ def main():
     
     # List files
     if total_files > 0:
-        for filename in os.listdir(scraper.output_dir):
-            if filename.endswith('.csv'):
-                file_path = os.path.join(scraper.output_dir, filename)
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    review_count = sum(1 for line in f) - 1  # Subtract header
-
-                print(f"  {filename}: {review_count} reviews")
+        with os.scandir(scraper.output_dir) as it:
+            csv_entries = [entry for entry in it if entry.name.endswith('.csv') and entry.is_file()]
+        # Count the files in parallel: _count_rows reads in large binary chunks and the
+        # reads release the GIL, so they overlap across files; the print order is kept
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            review_counts = executor.map(_count_rows, [entry.path for entry in csv_entries])
+            for entry, review_count in zip(csv_entries, review_counts):
+                print(f"  {entry.name}: {review_count} reviews")
     
     # Quick duplicate test
     print(f"\nTesting duplicate handling...")
     test_url = app_urls[0]
     try:
-        csv_path = scraper.scrap(test_url, max_reviews=5)
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            final_count = sum(1 for line in f) - 1
+        test_app_id = scraper.extract_app_id(test_url)
+        # With a TTL, a recent file holding enough reviews is reused instead of scraping
+        cached_path = scraper.get_cached_csv(test_app_id) if scraper.ttl_seconds else None
+        if cached_path and _count_rows(cached_path) >= 5:
+            print(f"- Duplicate test skipped: reviews served from cache ({cached_path})")
+        else:
+            csv_path = os.path.join(scraper.output_dir, f"{test_app_id}.csv")
+            initial_count = _count_rows(csv_path) if os.path.exists(csv_path) else 0
+            csv_path = scraper.scrap(test_url, max_reviews=5)
+            final_count = _count_rows(csv_path)
 
-        print(f"✓ No duplicates added. Final count: {final_count}")
+            if final_count == initial_count:
+                print(f"✓ No duplicates added. Final count: {final_count}")
+            else:
+                # Reviews posted since the first scrape are legitimately new
+                print(f"✓ {final_count - initial_count} new reviews added. Final count: {final_count}")
 
     except Exception as e:
         print(f"✗ Test failed: {e}")
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
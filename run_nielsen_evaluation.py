@@ -1,11 +1,16 @@
+import asyncio
+import functools
 import os
+import numpy as np
 import pandas as pd
+import statistics
 import time
 from datetime import datetime
 from dotenv import load_dotenv
 from components.data_analyzer import DataAnalyzer
+from components.llm_client import LLMClient
 from components.llm_factory import LLMClientFactory
-from components.active_persona import ActivePersona
+from components.active_persona import ActivePersona, preload_images
 from components.nielsen_evaluator import NielsenEvaluator
 from components.logger import Logger
 
@@ -15,12 +20,36 @@ persona_dir = os.getenv("PERSONA_DIR")
 prompt_dir = os.getenv("PROMPT_DIR")
 result_dir = os.getenv("RESULT_DIR")
 
+@functools.lru_cache(maxsize=64)
+def _read_text(path: str) -> str:
+    """
+    Read a prompt or persona markdown file, stripped of surrounding whitespace.
+    
+    Contents are cached by path, so repeated runs do not re-read the templates.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read().strip()
+
+def _find_missing_files(paths: list[str]) -> list[str]:
+    """
+    Return the paths that are not existing files, listing each parent directory once.
+    """
+    present_by_dir = {}
+    for directory in {os.path.dirname(path) for path in paths}:
+        try:
+            with os.scandir(directory or '.') as entries:
+                present_by_dir[directory] = {entry.name for entry in entries if entry.is_file()}
+        except (FileNotFoundError, NotADirectoryError):
+            present_by_dir[directory] = set()
+    return [path for path in paths if os.path.basename(path) not in present_by_dir[os.path.dirname(path)]]
+
 def run_evaluations(
     llm_model_names: list[str],
     persona_names: list[str],
     images: list[str] = [],
     save_in: str = "./results/nielsen_evaluations",
-    iterations: int = 10
+    iterations: int = 10,
+    max_concurrency: int = 4
 ):
     """
     Execute Nielsen heuristics evaluations using AI personas.
@@ -29,7 +58,7 @@ def run_evaluations(
     1. Loads evaluation prompts and system templates
     2. Validates image assets exist
     3. Creates LLM clients and active personas
-    4. Runs evaluations with timing metrics
+    4. Runs evaluations concurrently with timing metrics
     
     Args:
         llm_model_names: List of LLM model identifiers to use
@@ -37,18 +66,18 @@ def run_evaluations(
         images: List of image file paths for evaluation
         save_in: Directory path to save evaluation results
         iterations: Number of evaluation runs per persona-model combination
+        max_concurrency: Maximum number of persona-model combinations evaluated at once
     """
     Logger.info("Starting Nielsen heuristics evaluation workflow")
     
     # Load Nielsen evaluation prompt template
-    with open(f"./{prompt_dir}/nielsen_evaluation.md", 'r', encoding='utf-8') as f:
-        nielsen_evaluation_prompt = f.read().strip()
+    nielsen_evaluation_prompt = _read_text(f"./{prompt_dir}/nielsen_evaluation.md")
 
     # Initialize evaluator with the prompt
     evaluator = NielsenEvaluator(evaluation_prompt=nielsen_evaluation_prompt)
 
     # Validate all image files exist before proceeding
-    missing_images = [img for img in images if not os.path.isfile(img)]
+    missing_images = _find_missing_files(images)
     if missing_images:
         Logger.error("Missing image files:")
         for img in missing_images:
@@ -56,55 +85,105 @@ def run_evaluations(
         raise FileNotFoundError("One or more images are missing. Aborting execution.")
     
     Logger.info("All image files validated")
-    evaluator.set_images(images)
+    # Read and encode the images once; every persona, model and iteration reuses them
+    evaluator.set_images(preload_images(images))
 
     # Create LLM clients for all specified models
     Logger.info("Initializing LLM clients...")
     llm_clients = LLMClientFactory.create_clients(llm_model_names)
 
     # Load system prompt template for persona configuration
-    with open(f"./{prompt_dir}/system_prompt_template.md", 'r', encoding='utf-8') as f:
-        system_prompt_template = f.read().strip()
+    system_prompt_template = _read_text(f"./{prompt_dir}/system_prompt_template.md")
 
     # Create active personas for each persona-model combination
     Logger.info("Creating active personas...")
-    active_personas = {}
-    for persona_name in persona_names:
-        # Load persona description from markdown file
-        with open(f"./{persona_dir}/{persona_name}.md", 'r', encoding='utf-8') as f:
-            persona_description = f.read().strip()
-
-        # Inject persona details into system prompt template
-        system_prompt = system_prompt_template.replace('[persona_detail]', persona_description)
-
-        # Create persona instance for each LLM model
-        for model_name, llm_client in llm_clients.items():
-            persona_key = f"{persona_name}_{model_name}"
-            active_personas[persona_key] = ActivePersona(
-                name=persona_key,
-                llm_client=llm_client,
-                system_prompt=system_prompt
-            )
+    # Inject each persona's description (markdown file) into the system prompt template once;
+    # the same string is shared by all models, keeping it identical for provider prompt caching
+    persona_prompts = {
+        persona_name: system_prompt_template.replace('[persona_detail]', _read_text(f"./{persona_dir}/{persona_name}.md"))
+        for persona_name in persona_names
+    }
+
+    # Create persona instance for each LLM model
+    active_personas = {
+        f"{persona_name}_{model_name}": ActivePersona(
+            name=f"{persona_name}_{model_name}",
+            llm_client=llm_client,
+            system_prompt=system_prompt
+        )
+        for persona_name, system_prompt in persona_prompts.items()
+        for model_name, llm_client in llm_clients.items()
+    }
 
     # Create output directory and run evaluations
     os.makedirs(save_in, exist_ok=True)
     Logger.info(f"Results directory: {save_in}")
 
     # Execute evaluations for each persona-model combination
-    for persona_key, active_persona in active_personas.items():
-        Logger.info(f"Evaluating {persona_key}...")
-        
-        start_time = time.time()
-        evaluator.evaluate_and_save(
-            active_persona=active_persona,
-            iterations=iterations,
-            save_in=save_in
-        )
-        
-        # Log timing metrics
-        duration = time.time() - start_time
-        avg_duration = duration / iterations
-        Logger.info(f"Completed {persona_key} in {duration:.1f}s (avg: {avg_duration:.1f}s per iteration)")
+    asyncio.run(_evaluate_personas(evaluator, active_personas, iterations, save_in, max_concurrency))
+
+def _log_iteration_latency(persona_key: str, iteration_ms: list[float]):
+    """
+    Log the p50/p95 latency of the individual iterations, to spot outlier calls.
+    """
+    if not iteration_ms:
+        return
+    if len(iteration_ms) > 1:
+        cut_points = statistics.quantiles(iteration_ms, n=20, method='inclusive')
+        p50, p95 = cut_points[9], cut_points[18]
+    else:
+        p50 = p95 = iteration_ms[0]
+    Logger.info(f"{persona_key} iteration latency: p50 {p50:.0f}ms, p95 {p95:.0f}ms, max {max(iteration_ms):.0f}ms")
+
+async def _evaluate_personas(
+    evaluator: NielsenEvaluator,
+    active_personas: dict[str, ActivePersona],
+    iterations: int,
+    save_in: str,
+    max_concurrency: int
+):
+    """
+    Evaluate all persona-model combinations concurrently, at most max_concurrency at a time.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _run_one(persona_key: str, active_persona: ActivePersona):
+        async with semaphore:
+            Logger.info(f"Evaluating {persona_key}...")
+            
+            iteration_ms = []
+            start_ns = time.perf_counter_ns()
+            await evaluator.evaluate_and_save_async(
+                active_persona=active_persona,
+                iterations=iterations,
+                save_in=save_in,
+                on_iter_done=lambda iteration, ms: iteration_ms.append(ms)
+            )
+            
+            # Log timing metrics
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
+            avg_duration = duration / iterations
+            Logger.info(f"Completed {persona_key} in {duration:.1f}s (avg: {avg_duration:.1f}s per iteration)")
+            _log_iteration_latency(persona_key, iteration_ms)
+
+    try:
+        await asyncio.gather(*(
+            _run_one(persona_key, active_persona)
+            for persona_key, active_persona in active_personas.items()
+        ))
+    finally:
+        # Release the connections before asyncio.run closes the event loop
+        await LLMClient.aclose_async_clients()
+
+def _has_csv_files(directory: str) -> bool:
+    """
+    Check whether directory directly contains at least one CSV file, stopping at the first one.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return any(entry.name.endswith('.csv') and entry.is_file() for entry in entries)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
 
 def perform_statistical_analysis(result_dir: str = "./result"):
     """
@@ -118,6 +197,11 @@ def perform_statistical_analysis(result_dir: str = "./result"):
         result_dir: Directory containing evaluation CSV files
     """
     Logger.info("Preparing evaluation dataset...")
+
+    # Fail fast, before setting up the analyzer, when there is nothing to merge
+    if not _has_csv_files(result_dir):
+        Logger.error(f"No evaluation CSV files found in {result_dir} - nothing to analyze")
+        return
     
     # Statistical significance threshold
     ALPHA = 0.05
@@ -147,8 +231,8 @@ def perform_statistical_analysis(result_dir: str = "./result"):
 
     # Interpret results and add decision column
     Logger.info(f"Interpreting results (alpha = {ALPHA})...")
-    kruskal_results['Decision'] = kruskal_results['pvalue'].apply(
-        lambda p: 'Significant' if p < ALPHA else 'Not significant'
+    kruskal_results['Decision'] = np.where(
+        kruskal_results['pvalue'].to_numpy() < ALPHA, 'Significant', 'Not significant'
     )
     
     Logger.info("Statistical analysis completed")
@@ -161,7 +245,9 @@ def perform_statistical_analysis(result_dir: str = "./result"):
 
     # Save results with decisions
     output_file = os.path.join(analysis_output_dir, 'kruskal_wallis_results_with_decision.csv')
-    kruskal_results.to_csv(output_file)
+    # The index holds the question IDs, so it is kept; 6 significant digits suffice for the statistics
+    float_columns = kruskal_results.select_dtypes('float64').columns
+    kruskal_results.astype({column: 'float32' for column in float_columns}).to_csv(output_file, float_format='%.6g')
     Logger.info(f"Results saved to: {output_file}")
 
 